@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Matcher stratejileri için basit karşılaştırma.
+Her strateji, eski davranışa (her çağrıda re.escape + re.finditer) karşı ölçülür
+ve aynı ofsetleri döndürdüğü doğrulanır.
+
+Kullanım: python benchmarks/matcher_benchmark.py
+"""
+
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.matcher import get_matcher
+
+# Yoğun: anahtar kelime her cümlede geçer. Seyrek: büyük sayfada birkaç eşleşme.
+SAMPLES = {
+    'yoğun': (
+        "Şirketimiz sürdürülebilirlik alanında yeni bir rapor yayımladı. "
+        "Sürdürülebilirlik hedefleri, veri merkezlerinde enerji verimliliği ve "
+        "yenilenebilir kaynaklar üzerine kuruludur. Veri odaklı yaklaşım önemlidir. "
+        "Işık kirliliği ve IŞIK ışık ölçümleri. "
+    ) * 2000,
+    'seyrek': (
+        "Şirketimiz yenilenebilir enerji ve karbon azaltımı üzerine çalışmaktadır. " * 6000
+        + "Veri merkezleri ve veri güvenliği. Işık kirliliği ve IŞIK ışık. "
+    ),
+}
+
+CASES = [
+    ('literal', 'veri', True, False),
+    ('regex', 'veri', False, False),
+    ('regex', 'ışık', False, False),
+    ('regex', 'veri', False, True),
+]
+REPEAT = 20
+
+
+def legacy_spans(text, keyword, case_sensitive, whole_word):
+    """Önceki uygulama: her çağrıda desen oluşturup derler."""
+    flags = 0 if case_sensitive else re.IGNORECASE
+    pattern = re.escape(keyword)
+    if whole_word:
+        pattern = r'\b' + pattern + r'\b'
+    return [m.span() for m in re.finditer(pattern, text, flags)]
+
+
+def run(sample):
+    print(f"{'strateji':<10} {'kelime':<6} {'eski (ms)':>10} {'yeni (ms)':>10} {'hızlanma':>9} {'eşleşme':>8}")
+    for name, keyword, case_sensitive, whole_word in CASES:
+        matcher = get_matcher(keyword, case_sensitive, whole_word)
+        assert matcher.strategy == name, matcher.strategy
+
+        expected = legacy_spans(sample, keyword, case_sensitive, whole_word)
+        assert list(matcher.finditer(sample)) == expected, name
+
+        legacy = timeit.timeit(lambda: legacy_spans(sample, keyword, case_sensitive, whole_word), number=REPEAT)
+        current = timeit.timeit(
+            lambda: list(get_matcher(keyword, case_sensitive, whole_word).finditer(sample)), number=REPEAT
+        )
+        print(f"{name:<10} {keyword:<6} {legacy / REPEAT * 1000:>10.2f} {current / REPEAT * 1000:>10.2f} "
+              f"{legacy / current:>8.1f}x {len(expected):>8}")
+
+
+def main():
+    for label, sample in SAMPLES.items():
+        print(f"\n[{label}] metin uzunluğu: {len(sample):,} karakter, tekrar: {REPEAT}")
+        run(sample)
+
+
+if __name__ == "__main__":
+    main()
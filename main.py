@@ -7,6 +7,7 @@ Tarih: 2025
 
 import sys
 import os
+import multiprocessing
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt
 
@@ -42,4 +43,6 @@ def main():
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
+    # PyInstaller ile paketlenmiş sürümde process havuzunun çalışabilmesi için gerekli
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Web Scraper PDF Generator - HTTP Sunucu Modu
+Tarayıcıyı tek bir makinede paylaşılan servis olarak çalıştırır.
+"""
+
+import sys
+import os
+import argparse
+
+# Proje dizinini sys.path'e ekle
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.server.api import run_server
+
+def main():
+    """Sunucuyu komut satırı argümanlarıyla başlatır"""
+    parser = argparse.ArgumentParser(description="Web Scraper PDF Generator HTTP sunucusu")
+    parser.add_argument('--host', help="Dinlenecek adres (varsayılan: config'deki server.host)")
+    parser.add_argument('--port', type=int, help="Dinlenecek port (varsayılan: config'deki server.port)")
+    args = parser.parse_args()
+
+    run_server(args.host, args.port)
+
+if __name__ == "__main__":
+    main()
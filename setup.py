@@ -43,6 +43,7 @@ setup(
     entry_points={
         "console_scripts": [
             "webscraper=main:main",
+            "webscraper-server=server:main",
         ],
     },
     include_package_data=True,
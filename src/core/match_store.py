@@ -0,0 +1,91 @@
+# src/core/match_store.py
+
+from array import array
+
+
+class MatchStore:
+    """
+    Eşleşmeleri metin kopyası tutmadan saklayan kompakt yapı.
+    Her anahtar kelime için başlangıç/bitiş ofsetleri paralel tamsayı dizilerinde
+    tutulur; bağlam metni yalnızca rapor yazılırken, paylaşılan metinden kesilir.
+    """
+
+    # Birleştirilmiş bir penceredeki en fazla eşleşme; yoğun sayfalarda tüm metnin tek
+    # paragrafa dönüşmesini (ReportLab'da karesel yerleşim süresi) engeller
+    MAX_WINDOW_SPANS = 25
+
+    def __init__(self, text, context_radius=150):
+        self.text = text
+        self.context_radius = context_radius
+        # Metni zaten kelimelere ayıran aşamalar (ör. TextIndex) doldurur; None ise sayılmamıştır
+        self.word_count = None
+        self._starts = {}
+        self._ends = {}
+
+    def add(self, keyword, start, end):
+        """Tek bir eşleşme ekler."""
+        if keyword not in self._starts:
+            self._starts[keyword] = array('l')
+            self._ends[keyword] = array('l')
+        self._starts[keyword].append(start)
+        self._ends[keyword].append(end)
+
+    def extend(self, keyword, spans):
+        """(başlangıç, bitiş) çiftlerini toplu olarak ekler."""
+        starts = self._starts.setdefault(keyword, array('l'))
+        ends = self._ends.setdefault(keyword, array('l'))
+        for start, end in spans:
+            starts.append(start)
+            ends.append(end)
+        if not starts:
+            del self._starts[keyword], self._ends[keyword]
+
+    def keywords(self):
+        """Eşleşmesi olan anahtar kelimeleri döndürür."""
+        return list(self._starts)
+
+    def count(self, keyword=None):
+        """Bir anahtar kelimenin (ya da tümünün) eşleşme sayısını döndürür."""
+        if keyword is not None:
+            return len(self._starts.get(keyword, ()))
+        return sum(len(starts) for starts in self._starts.values())
+
+    def __len__(self):
+        return self.count()
+
+    def spans(self, keyword):
+        """Anahtar kelimenin (başlangıç, bitiş) ofsetlerini sırayla döndürür."""
+        return zip(self._starts.get(keyword, ()), self._ends.get(keyword, ()))
+
+    def context(self, keyword, i, radius=None):
+        """i. eşleşmenin bağlamını orijinal metinden keserek döndürür."""
+        radius = self.context_radius if radius is None else radius
+        start = max(0, self._starts[keyword][i] - radius)
+        end = min(len(self.text), self._ends[keyword][i] + radius)
+        return self.text[start:end].strip()
+
+    def windows(self, keyword, radius=None, merge=True):
+        """
+        Bağlam pencerelerini (başlangıç, bitiş, [(eşleşme başı, eşleşme sonu), ...])
+        olarak döndürür. merge=True ise çakışan pencereler tek pencerede birleştirilir;
+        pencere MAX_WINDOW_SPANS eşleşmeye ulaşınca yeni eşleşmenin başından bölünür.
+        """
+        radius = self.context_radius if radius is None else radius
+        text_length = len(self.text)
+        window = None
+        for start, end in self.spans(keyword):
+            window_start = max(0, start - radius)
+            window_end = min(text_length, end + radius)
+            if window is not None and merge and window_start <= window[1]:
+                if len(window[2]) < self.MAX_WINDOW_SPANS:
+                    window[1] = max(window[1], window_end)
+                    window[2].append((start, end))
+                    continue
+                if window[2][-1][1] <= start:
+                    # Pencereler uç uca gelir; aradaki metin iki kez yazılmaz
+                    window[1] = window_start = start
+            if window is not None:
+                yield tuple(window)
+            window = [window_start, window_end, [(start, end)]]
+        if window is not None:
+            yield tuple(window)
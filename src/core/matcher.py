@@ -0,0 +1,58 @@
+# src/core/matcher.py
+
+import re
+from functools import lru_cache
+
+
+class LiteralMatcher:
+    """Büyük/küçük harfe duyarlı, kelime sınırı gerektirmeyen arama: regex yerine str.find döngüsü."""
+
+    strategy = 'literal'
+
+    def __init__(self, keyword):
+        self.keyword = keyword
+
+    def finditer(self, text):
+        """(başlangıç, bitiş) ofsetlerini sırayla döndürür."""
+        keyword = self.keyword
+        length = len(keyword)
+        if not length:
+            return
+        find = text.find
+        pos = find(keyword)
+        while pos != -1:
+            yield pos, pos + length
+            pos = find(keyword, pos + length)
+
+
+class RegexMatcher:
+    """
+    Harfe duyarsız ya da kelime sınırı gerektiren aramalar için önceden derlenmiş regex.
+    re.IGNORECASE, str.lower()'ın kaçırdığı denklikleri de yakalar (I/ı, ſ/s, ς/σ).
+    """
+
+    strategy = 'regex'
+
+    def __init__(self, keyword, flags=0, whole_word=False):
+        pattern = re.escape(keyword)
+        if whole_word:
+            # \b kelime sınırı demektir. 'veri' ararken 'verimli' bulmaz.
+            pattern = r'\b' + pattern + r'\b'
+        self.pattern = re.compile(pattern, flags)
+
+    def finditer(self, text):
+        for match in self.pattern.finditer(text):
+            yield match.span()
+
+
+@lru_cache(maxsize=256)
+def get_matcher(keyword, case_sensitive=False, whole_word=False):
+    """
+    Arama seçeneklerine göre en ucuz stratejiyi seçer ve önbelleğe alır.
+    Aynı (keyword, seçenekler) için her çağrıda aynı matcher nesnesi döner.
+    """
+    if whole_word:
+        return RegexMatcher(keyword, 0 if case_sensitive else re.IGNORECASE, whole_word=True)
+    if case_sensitive:
+        return LiteralMatcher(keyword)
+    return RegexMatcher(keyword, re.IGNORECASE)
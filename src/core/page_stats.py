@@ -0,0 +1,101 @@
+# src/core/page_stats.py
+
+import heapq
+from collections import Counter
+
+from .text_index import WORD_RE
+
+HISTOGRAM_BINS = 10
+TOP_TERMS = 10
+MIN_TERM_LENGTH = 3
+
+# Birlikte geçen terimlerden çıkarılan yaygın Türkçe/İngilizce kelimeler
+STOPWORDS = frozenset({
+    've', 'ile', 'bir', 'bu', 'şu', 'da', 'de', 'için', 'gibi', 'çok', 'daha', 'en', 'olan',
+    'olarak', 'ya', 'veya', 'ama', 'fakat', 'ancak', 'her', 'hem', 'ki', 'mi', 'ne', 'o',
+    'biz', 'siz', 'onlar', 'ben', 'sen', 'kadar', 'sonra', 'önce', 'göre', 'ise', 'değil',
+    'var', 'yok', 'oldu', 'olur', 'olduğu', 'tüm', 'bütün', 'bazı', 'diğer',
+    'the', 'and', 'for', 'with', 'that', 'this', 'are', 'was', 'from', 'you', 'your',
+    'our', 'not', 'but', 'have', 'has', 'all', 'can', 'will', 'more',
+})
+
+
+class PageStats:
+    """Bir sayfanın kelime sayısı, anahtar kelime yoğunluğu, konum dağılımı ve birlikte geçen terimleri."""
+
+    def __init__(self, url, word_count, match_count, histogram, top_terms):
+        self.url = url
+        self.word_count = word_count
+        self.match_count = match_count
+        self.histogram = histogram
+        self.top_terms = top_terms
+
+    @property
+    def density(self):
+        """Anahtar kelime yoğunluğu (eşleşme / kelime)."""
+        return self.match_count / self.word_count if self.word_count else 0.0
+
+    @classmethod
+    def from_matches(cls, url, matches, keyword, bins=HISTOGRAM_BINS, top_n=TOP_TERMS):
+        """
+        İstatistikleri eşleşme ofsetlerinden çıkarır; metin ikinci kez taranmaz.
+        Kelime sayısı WORD_RE kelimeleriyle (|, », © gibi ayraçlar sayılmaz) hesaplanır;
+        fuzzy modda TextIndex'in saydığı değer kullanılır. Birlikte geçen terimler yalnızca
+        eşleşmelerin bağlam pencerelerinden çıkarılır.
+        """
+        text = matches.text
+        word_count = matches.word_count
+        if word_count is None:
+            word_count = len(WORD_RE.findall(text))
+
+        histogram = [0] * bins
+        for start, _ in matches.spans(keyword):
+            histogram[min(bins - 1, start * bins // len(text))] += 1
+
+        keyword_terms = {w.lower() for w in WORD_RE.findall(keyword)}
+        terms = Counter()
+        for window_start, window_end, spans in matches.windows(keyword):
+            cursor = window_start
+            for start, end in spans + [(window_end, window_end)]:
+                for word in WORD_RE.findall(text, cursor, start):
+                    word = word.lower()
+                    if (len(word) >= MIN_TERM_LENGTH and not word.isdigit()
+                            and word not in STOPWORDS and word not in keyword_terms):
+                        terms[word] += 1
+                cursor = end
+
+        return cls(url, word_count, matches.count(keyword), histogram, terms.most_common(top_n))
+
+
+class StatsIndex:
+    """Toplu taramadaki sayfa istatistiklerini tutar ve sorgulanmasını sağlar."""
+
+    def __init__(self):
+        self._pages = {}
+
+    def add(self, stats):
+        self._pages[stats.url] = stats
+
+    def get(self, url):
+        return self._pages.get(url)
+
+    def remove(self, url):
+        self._pages.pop(url, None)
+
+    def __len__(self):
+        return len(self._pages)
+
+    def top_by_density(self, n=50):
+        """En yüksek anahtar kelime yoğunluğuna sahip n sayfa."""
+        return heapq.nlargest(n, self._pages.values(), key=lambda s: s.density)
+
+    def top_by_matches(self, n=50):
+        """En çok eşleşme içeren n sayfa."""
+        return heapq.nlargest(n, self._pages.values(), key=lambda s: s.match_count)
+
+    def top_terms(self, n=TOP_TERMS):
+        """Tüm sayfalarda anahtar kelimeyle en sık birlikte geçen terimler."""
+        total = Counter()
+        for stats in self._pages.values():
+            total.update(dict(stats.top_terms))
+        return total.most_common(n)
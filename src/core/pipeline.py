@@ -0,0 +1,129 @@
+# src/core/pipeline.py
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python 3.7: paylaşımlı bellek yok, gövde doğrudan kopyalanır
+    shared_memory = None
+
+# Bu boyutun üzerindeki yanıt gövdeleri pickle yerine paylaşımlı bellekle aktarılır
+SHARED_MEMORY_THRESHOLD = 1024 * 1024
+
+
+def _pack_body(content):
+    """Yanıt gövdesini process'e aktarılabilir hale getirir. (gövde, shm) döndürür."""
+    if shared_memory is None or len(content) < SHARED_MEMORY_THRESHOLD:
+        return content, None
+    shm = shared_memory.SharedMemory(create=True, size=len(content))
+    shm.buf[:len(content)] = content
+    return ('shm', shm.name, len(content)), shm
+
+
+def _unpack_body(body):
+    """İşçi process tarafında gövdeyi (gerekirse paylaşımlı bellekten) okur."""
+    if isinstance(body, bytes):
+        return body
+    _, name, size = body
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        # Bloğun sahibi ana process'tir; işçi yalnızca okuyup kapatır, unlink etmez
+        return bytes(shm.buf[:size])
+    finally:
+        shm.close()
+
+
+# İşçi process başına bir kez oluşturulan rapor üretici (font kaydı ve stiller pahalı)
+_pdf_generator = None
+
+
+def _get_pdf_generator():
+    global _pdf_generator
+    if _pdf_generator is None:
+        from ..utils.pdf_generator import PDFGenerator
+        _pdf_generator = PDFGenerator()
+    return _pdf_generator
+
+
+def _parse_and_match(url, body, keyword, case_sensitive, whole_word, match_mode, context_radius=None,
+                     save_path=None, name_suffix=None, render_mode='off'):
+    """
+    İşçi process'te çalışır: HTML'i ayrıştırır, temizler, eşleşmeleri ve sayfa istatistiklerini
+    çıkarır, save_path verildiyse PDF raporunu da yazar. Ana process'e metin ve eşleşmeler
+    yerine yalnızca (PageStats, pdf_path, eşleşme sayısı, render gerekli mi) döner.
+    Sayfa tarayıcıda render edilmesi gereken bir kabuksa rapor yazılmaz.
+    """
+    from .scraper import WebScraper
+    from .page_stats import PageStats
+
+    page_info, text, client_rendered = WebScraper._parse_page(_unpack_body(body), url)
+    if WebScraper._needs_render(render_mode, text, client_rendered):
+        return None, None, 0, True
+    matches = WebScraper._find_matches_in_text(text, keyword, case_sensitive, whole_word, match_mode)
+    if context_radius is not None:
+        # İstatistikler raporla aynı bağlam penceresiyle hesaplanmalı
+        matches.context_radius = context_radius
+    page_info['stats'] = PageStats.from_matches(url, matches, keyword)
+    pdf_path = None
+    if save_path is not None:
+        pdf_path = _get_pdf_generator().create_pdf(
+            matches, keyword, page_info, save_path,
+            case_sensitive, whole_word, match_mode, name_suffix
+        )
+    return page_info['stats'], pdf_path, len(matches), False
+
+
+class ParseMatchPipeline:
+    """
+    CPU yoğun ayrıştırma/eşleştirme/rapor aşamasını process havuzunda çalıştırır.
+    Bekleyen iş sayısı sınırlıdır; havuz dolduğunda submit() bloklanarak
+    I/O aşamasını yavaşlatır (backpressure).
+    """
+
+    def __init__(self, max_workers=None, max_pending=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.max_workers * 2
+        # fork, çalışan thread'lerin (indirme, QueueListener, BrowserPool) tuttuğu kilitleri
+        # işçiye kopyalayıp kilitlenmeye yol açabilir; Windows/PyInstaller'daki gibi spawn kullanılır
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers, mp_context=multiprocessing.get_context('spawn')
+        )
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+
+    def submit(self, url, content, keyword, case_sensitive=False, whole_word=False, match_mode='exact',
+               context_radius=None, save_path=None, name_suffix=None, render_mode='off'):
+        """
+        Ham yanıt gövdesini işlenmek üzere gönderir.
+        (PageStats, pdf_path, eşleşme sayısı, render gerekli mi) döndüren Future verir.
+        """
+        self._slots.acquire()
+        try:
+            body, shm = _pack_body(content)
+            future = self._executor.submit(
+                _parse_and_match, url, body, keyword, case_sensitive, whole_word, match_mode,
+                context_radius, save_path, name_suffix, render_mode
+            )
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._release(shm))
+        return future
+
+    def _release(self, shm):
+        """İş bittiğinde paylaşımlı belleği serbest bırakır ve yeni işe yer açar."""
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+        self._slots.release()
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
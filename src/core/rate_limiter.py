@@ -0,0 +1,145 @@
+# src/core/rate_limiter.py
+
+import threading
+import time
+from collections import OrderedDict, deque
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    Tek bir host için token-bucket hız sınırlayıcı.
+    Thread-safe değildir; HostScheduler kilidi altında kullanılır.
+    """
+
+    def __init__(self, rate, burst, min_rate=0.05):
+        self.base_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = max(1.0, float(burst))
+        self.min_rate = min(min_rate, self.base_rate)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def _refill(self, now):
+        """Geçen süreye göre token ekler (en fazla burst kadar)."""
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def wait_time(self, now):
+        """Bir token alınabilmesi için beklenmesi gereken süreyi (saniye) döndürür."""
+        self._refill(now)
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def consume(self):
+        """Bir token harcar. Önce wait_time() ile uygunluk kontrol edilmelidir."""
+        self.tokens -= 1
+
+    def slow_down(self, now, factor, retry_after=None):
+        """429/503 sonrası hızı düşürür ve host'u bir süre bekletir."""
+        self.rate = max(self.min_rate, self.rate * factor)
+        self.tokens = min(self.tokens, 0.0)
+        delay = retry_after if retry_after is not None else 1.0 / self.rate
+        self.blocked_until = max(self.blocked_until, now + delay)
+
+    def recover(self, step):
+        """Başarılı yanıtlarda hızı kademeli olarak temel değere geri taşır."""
+        if self.rate < self.base_rate:
+            self.rate = min(self.base_rate, self.rate + step)
+
+
+class HostScheduler:
+    """
+    Host bazlı nezaket (politeness) zamanlayıcısı.
+    Her host kendi token-bucket'ına sahiptir; 429/503 yanıtlarında ilgili host
+    yavaşlatılır, başarılı yanıtlarda hız yeniden yükselir.
+    """
+
+    SLOW_DOWN_STATUSES = (429, 503)
+
+    def __init__(self, requests_per_second=2.0, burst=4, backoff_factor=0.5, max_backoff=300):
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second pozitif olmalıdır.")
+        self.requests_per_second = float(requests_per_second)
+        self.burst = burst
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.recovery_step = self.requests_per_second * 0.1
+        self._buckets = {}
+        self._cond = threading.Condition()
+
+    @staticmethod
+    def host_of(url):
+        """URL'nin host kısmını döndürür."""
+        return urlparse(url).netloc.lower()
+
+    def _bucket(self, host):
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(self.requests_per_second, self.burst)
+        return bucket
+
+    def acquire(self, url):
+        """URL'nin host'u için bir token alınana kadar bekler."""
+        host = self.host_of(url)
+        with self._cond:
+            bucket = self._bucket(host)
+            while True:
+                wait = bucket.wait_time(time.monotonic())
+                if wait <= 0:
+                    bucket.consume()
+                    return
+                self._cond.wait(wait)
+
+    def fair_order(self, urls):
+        """
+        URL'leri host'lar arasında round-robin sırayla, hız sınırlarına uyarak verir.
+        Kotası dolan host atlanıp sıradaki hazır host'a geçilir; böylece tek host'lu
+        büyük bir grup diğer host'ları bekletmez. Dönen her URL için token ayrılmıştır.
+        """
+        queues = OrderedDict()
+        for url in urls:
+            queues.setdefault(self.host_of(url), deque()).append(url)
+
+        while queues:
+            ready = None
+            next_wait = None
+            with self._cond:
+                now = time.monotonic()
+                for host in queues:
+                    bucket = self._bucket(host)
+                    wait = bucket.wait_time(now)
+                    if wait <= 0:
+                        bucket.consume()
+                        ready = host
+                        break
+                    next_wait = wait if next_wait is None else min(next_wait, wait)
+                if ready is None:
+                    self._cond.wait(next_wait)
+                    continue
+
+            url = queues[ready].popleft()
+            if queues[ready]:
+                queues.move_to_end(ready)
+            else:
+                del queues[ready]
+            yield url
+
+    def feedback(self, url, status_code, retry_after=None):
+        """Yanıt durum koduna göre host'un hızını uyarlar."""
+        host = self.host_of(url)
+        with self._cond:
+            bucket = self._bucket(host)
+            if status_code in self.SLOW_DOWN_STATUSES:
+                if retry_after is not None:
+                    retry_after = min(retry_after, self.max_backoff)
+                bucket.slow_down(time.monotonic(), self.backoff_factor, retry_after)
+            elif status_code < 400:
+                bucket.recover(self.recovery_step)
+            self._cond.notify_all()
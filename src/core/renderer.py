@@ -0,0 +1,126 @@
+# src/core/renderer.py
+
+import asyncio
+import atexit
+import threading
+
+try:
+    from playwright.async_api import async_playwright
+except ImportError:  # Opsiyonel bağımlılık: yoksa yalnızca requests yolu kullanılır
+    async_playwright = None
+
+# Metin çıkarmak için gerekmeyen, bant genişliği ve bellek harcayan kaynaklar
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def is_available():
+    """Playwright kurulu mu?"""
+    return async_playwright is not None
+
+
+def get_browser_pool(size=2, timeout=30, user_agent=None):
+    """Süreç genelinde paylaşılan BrowserPool'u döndürür (ilk çağrıda oluşturulur)."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = BrowserPool(size=size, timeout=timeout, user_agent=user_agent)
+            atexit.register(_shared_pool.close)
+        return _shared_pool
+
+
+class BrowserPool:
+    """
+    JavaScript ile oluşturulan sayfalar için headless Chromium context havuzu.
+    Tarayıcı ve context'ler bir kez açılıp tekrar kullanılır; Playwright nesneleri
+    kendi event loop'unu çalıştıran ayrı bir thread'de yaşar, render() ise herhangi
+    bir thread'den çağrılabilir.
+    """
+
+    def __init__(self, size=2, timeout=30, user_agent=None):
+        if async_playwright is None:
+            raise RuntimeError(
+                "JavaScript render desteği için Playwright gerekli: "
+                "'pip install playwright' ve 'playwright install chromium' komutlarını çalıştırın."
+            )
+        self.size = size
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self._started = False
+        # Tarayıcı başlatılamadıysa (ör. 'playwright install chromium' çalıştırılmamış) hata saklanır;
+        # sonraki render() çağrıları yeni sürücü process'i açmadan hemen başarısız olur
+        self.start_error = None
+        self._start_lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='BrowserPool', daemon=True)
+        self._thread.start()
+
+    def _run(self, coro):
+        """Coroutine'i havuzun event loop'unda çalıştırıp sonucunu bekler."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _start(self):
+        self._playwright = await async_playwright().start()
+        try:
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            self._contexts = asyncio.Queue()
+            for _ in range(self.size):
+                context = await self._browser.new_context(user_agent=self.user_agent)
+                await context.route('**/*', self._block_heavy_resources)
+                self._contexts.put_nowait(context)
+        except Exception:
+            # Sürücü process'i (ve açıldıysa tarayıcı) açık kalmasın
+            await self._playwright.stop()
+            raise
+
+    @staticmethod
+    async def _block_heavy_resources(route):
+        """Görsel, font ve medya isteklerini iptal eder."""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _render(self, url):
+        context = await self._contexts.get()
+        page = None
+        try:
+            page = await context.new_page()
+            await page.goto(url, wait_until='networkidle', timeout=self.timeout * 1000)
+            return await page.content()
+        finally:
+            if page is not None:
+                await page.close()
+            self._contexts.put_nowait(context)
+
+    def render(self, url):
+        """Sayfayı tarayıcıda açar, ağ trafiği durulunca oluşan DOM'u HTML olarak döndürür."""
+        with self._start_lock:
+            if self.start_error is not None:
+                raise RuntimeError(f"Tarayıcı başlatılamadı: {self.start_error}") from self.start_error
+            if not self._started:
+                try:
+                    self._run(self._start())
+                except Exception as e:
+                    self.start_error = e
+                    raise
+                self._started = True
+        return self._run(self._render(url))
+
+    async def _stop(self):
+        while not self._contexts.empty():
+            await self._contexts.get_nowait().close()
+        await self._browser.close()
+        await self._playwright.stop()
+
+    def close(self):
+        """Tarayıcıyı kapatır ve event loop thread'ini durdurur."""
+        with self._start_lock:
+            if self._started:
+                self._run(self._stop())
+                self._started = False
+        if self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
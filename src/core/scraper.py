@@ -4,65 +4,290 @@ import requests
 from bs4 import BeautifulSoup
 import re
 import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
 from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from .rate_limiter import HostScheduler
+from .text_index import TextIndex
+from .match_store import MatchStore
+from .matcher import get_matcher
+from .pipeline import ParseMatchPipeline
+from .page_stats import PageStats, StatsIndex
+from . import renderer
 from ..utils.logger import Logger
 from ..utils.pdf_generator import PDFGenerator
+from ..utils.config import get_settings
 
 class WebScraper:
     """Web scraping işlemlerini gerçekleştiren, sadeleştirilmiş ana sınıf"""
+
+    # Eşleştirme modları: 'exact' birebir regex araması, 'fuzzy' Türkçe çekim/benzerlik araması
+    MATCH_EXACT = 'exact'
+    MATCH_FUZZY = 'fuzzy'
+
+    # Render modları: 'off' yalnızca requests, 'auto' boş kabuk sayfalarda tarayıcı, 'always' her zaman tarayıcı
+    RENDER_OFF = 'off'
+    RENDER_AUTO = 'auto'
+    RENDER_ALWAYS = 'always'
+    # Görünür metni bundan kısa olan script'li sayfalar istemci tarafında oluşturulmuş kabul edilir
+    MIN_STATIC_TEXT_LENGTH = 200
     
     def __init__(self):
         self.logger = Logger()
+        self.settings = get_settings().scraper
         self.pdf_generator = PDFGenerator()
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'User-Agent': self.settings.user_agent,
             'Accept-Language': 'tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
         })
+        adapter = HTTPAdapter(pool_connections=self.settings.max_workers, pool_maxsize=self.settings.max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Host bazlı hız sınırı: eşzamanlı taramalarda hedef siteleri yormamak için
+        self.scheduler = HostScheduler(
+            requests_per_second=self.settings.requests_per_second,
+            burst=self.settings.burst,
+            backoff_factor=self.settings.backoff_factor,
+        )
+
+        # Taranan sayfaların istatistikleri; toplu taramalarda sorgulanabilir (ör. yoğunluğa göre ilk 50)
+        self.stats_index = StatsIndex()
         
-    def scrape_and_save(self, url, keyword, save_path, case_sensitive=False, whole_word=False, progress_callback=None):
+    def scrape_and_save(self, url, keyword, save_path, case_sensitive=False, whole_word=False, progress_callback=None,
+                        match_mode=MATCH_EXACT):
         """
         Web sitesini tarar ve sonuçları PDF'e kaydeder.
         """
+        log = self.logger.bind(scan_id=uuid.uuid4().hex[:12], url=url)
         try:
             if progress_callback: progress_callback(f"🌐 {url} adresine bağlanılıyor...")
-            response = self._fetch_page(url)
+            with log.stage('fetch'):
+                response = self._fetch_page(url)
             
             if progress_callback: progress_callback("📄 Sayfa içeriği analiz ediliyor...")
-            soup = BeautifulSoup(response.content, 'html.parser')
-            page_info = self._extract_page_info(soup, url)
+            with log.stage('parse'):
+                page_info, text_content, client_rendered = self._parse_page(response.content, url)
+
+            if self._should_render(text_content, client_rendered):
+                if progress_callback: progress_callback("🖥️ Sayfa JavaScript ile oluşturuluyor, tarayıcıda açılıyor...")
+                with log.stage('render'):
+                    html = self._render_page(url)
+                if html is not None:
+                    page_info, text_content, _ = self._parse_page(html, url)
             
             if progress_callback: progress_callback(f"🔍 '{keyword}' kelimesi aranıyor...")
-            text_content = self._get_clean_text(soup)
-            matches = self._find_matches_in_text(text_content, keyword, case_sensitive, whole_word)
+            with log.stage('match'):
+                matches = self._find_matches_in_text(text_content, keyword, case_sensitive, whole_word, match_mode)
+                matches.context_radius = self.settings.context_length // 2
+                page_info['stats'] = PageStats.from_matches(url, matches, keyword)
+            self.stats_index.add(page_info['stats'])
             
             if progress_callback: progress_callback(f"✅ {len(matches)} adet eşleşme bulundu.")
             
             # PDF oluştur (eşleşme olmasa bile özet raporu oluşturulur)
             if progress_callback: progress_callback("📝 PDF raporu oluşturuluyor...")
-            pdf_path = self.pdf_generator.create_pdf(
-                matches, keyword, page_info, save_path, 
-                case_sensitive, whole_word
-            )
+            with log.stage('pdf'):
+                pdf_path = self.pdf_generator.create_pdf(
+                    matches, keyword, page_info, save_path, 
+                    case_sensitive, whole_word, match_mode
+                )
             
             if progress_callback: progress_callback(f"💾 PDF kaydedildi: {os.path.basename(pdf_path)}")
+            log.info("Tarama tamamlandı: %d eşleşme", len(matches), match_count=len(matches))
             return pdf_path, len(matches)
                 
         except Exception as e:
-            self.logger.error(f"Scraping hatası: {str(e)}")
+            log.error("Scraping hatası: %s", e)
             raise
+
+    def scrape_many(self, urls, keyword, save_path, case_sensitive=False, whole_word=False, progress_callback=None,
+                    match_mode=MATCH_EXACT, processes=None):
+        """
+        Çok sayıda URL'yi tarar ve her sayfa için ayrı PDF raporu oluşturur.
+        Sayfalar thread'lerde indirilir; ayrıştırma, eşleştirme ve PDF üretimi process havuzunda yapılır.
+        Sayfa istatistikleri self.stats_index üzerinden sorgulanabilir. Rapor adları URL'nin
+        listedeki sırası ve host'u ile ayrılır; aynı saniyede biten sayfalar birbirinin üzerine yazmaz.
+        {url: (pdf_path, eşleşme sayısı)} ya da hata durumunda {url: Exception} döndürür.
+        """
+        urls = list(urls)
+        report_names = {url: f"{number:03d}_{urlparse(url).netloc}" for number, url in enumerate(urls, 1)}
+        context_radius = self.settings.context_length // 2
+        results = {}
+        pending = {}
+        log = self.logger.bind(scan_id=uuid.uuid4().hex[:12])
+        log.info("Toplu tarama başladı: %d URL", len(urls), url_count=len(urls))
+
+        def finish(url, stats, pdf_path, match_count):
+            self.stats_index.add(stats)
+            results[url] = (pdf_path, match_count)
+            if progress_callback: progress_callback(f"💾 {url}: {match_count} eşleşme, {os.path.basename(pdf_path)}")
+
+        def submit(url, content, render_mode):
+            return pipeline.submit(url, content, keyword, case_sensitive, whole_word, match_mode,
+                                   context_radius, save_path, report_names[url], render_mode)
+
+        def save(future):
+            url, stage, content = pending.pop(future)
+            try:
+                if stage == 'render':
+                    html = future.result()
+                    # Render başarısız olduysa rapor statik içerikten üretilir
+                    body = content if html is None else html.encode('utf-8')
+                    pending[submit(url, body, self.RENDER_OFF)] = (url, 'parse', None)
+                    return
+                stats, pdf_path, match_count, needs_render = future.result()
+                if needs_render:
+                    # Boş kabuk sayfa: render ayrı thread havuzunda yapılır, bitince CPU aşamasına yeniden gönderilir
+                    pending[render_executor.submit(self._render_page, url)] = (url, 'render', content)
+                    return
+                finish(url, stats, pdf_path, match_count)
+            except Exception as e:
+                log.error("Scraping hatası (%s): %s", url, e, url=url)
+                results[url] = e
+
+        with ParseMatchPipeline(max_workers=processes) as pipeline, \
+                ThreadPoolExecutor(max_workers=self.settings.render_pool_size) as render_executor:
+            for url, response, error in self.fetch_many(urls):
+                if error is not None:
+                    results[url] = error
+                    if progress_callback: progress_callback(f"❌ {url}: {error}")
+                else:
+                    # Havuz doluysa submit bloklanır ve indirme hızı CPU aşamasına uyar. Gövde, render
+                    # başarısız olursa statik rapor için saklanır (bekleyen iş sayısı sınırlı)
+                    pending[submit(url, response.content, self.settings.render_mode)] = (url, 'parse', response.content)
+
+                for future in [f for f in pending if f.done()]:
+                    save(future)
+
+            # Render edilen sayfalar yeni iş ekleyebileceğinden kuyruk boşalana kadar bekle
+            while pending:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for future in done:
+                    save(future)
+
+        log.info("Toplu tarama tamamlandı: %d URL", len(results), url_count=len(results))
+        return results
             
-    def _fetch_page(self, url):
-        """Web sayfasını getirir."""
+    def fetch_many(self, urls, max_workers=None):
+        """
+        Birden çok URL'yi eşzamanlı getirir.
+        URL'ler host'lar arasında adil sırayla gönderilir; (url, response, hata)
+        üçlüleri tamamlanma sırasıyla döndürülür.
+        """
+        max_workers = max_workers or self.settings.max_workers
+        order = self.scheduler.fair_order(urls)
+        pending = {}
+        exhausted = False
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                # Boş işçi olduğu sürece sıradaki URL'yi al (token o anda ayrılır)
+                while not exhausted and len(pending) < max_workers:
+                    url = next(order, None)
+                    if url is None:
+                        exhausted = True
+                        break
+                    pending[executor.submit(self._fetch_page, url, True)] = url
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url = pending.pop(future)
+                    try:
+                        yield url, future.result(), None
+                    except Exception as e:
+                        self.logger.error("Scraping hatası (%s): %s", url, e, url=url)
+                        yield url, None, e
+
+    def _fetch_page(self, url, reserved=False):
+        """
+        Web sayfasını host bazlı hız sınırına uyarak getirir.
+        reserved=True ise ilk deneme için token zaten ayrılmıştır.
+        """
         try:
-            response = self.session.get(url, timeout=15, allow_redirects=True)
-            response.raise_for_status()
-            return response
+            for attempt in range(self.settings.max_retries + 1):
+                if attempt > 0 or not reserved:
+                    self.scheduler.acquire(url)
+
+                response = self.session.get(url, timeout=self.settings.timeout, allow_redirects=True)
+                self.scheduler.feedback(url, response.status_code, self._retry_after(response))
+
+                if response.status_code in HostScheduler.SLOW_DOWN_STATUSES and attempt < self.settings.max_retries:
+                    self.logger.warning("%s -> %d, host yavaşlatılıyor (deneme %d)",
+                                        url, response.status_code, attempt + 1, url=url)
+                    continue
+
+                response.raise_for_status()
+                return response
         except requests.exceptions.RequestException as e:
             raise Exception(f"Sayfa erişim hatası: {e}")
+
+    def _should_render(self, text, client_rendered):
+        """Sayfanın tarayıcıda render edilmesi gerekip gerekmediğine karar verir."""
+        return self._needs_render(self.settings.render_mode, text, client_rendered)
+
+    @classmethod
+    def _needs_render(cls, render_mode, text, client_rendered):
+        """_should_render'ın ayarlardan bağımsız hali; işçi process'lerde de kullanılır."""
+        if render_mode == cls.RENDER_ALWAYS:
+            return True
+        return render_mode == cls.RENDER_AUTO and client_rendered and len(text) < cls.MIN_STATIC_TEXT_LENGTH
+
+    def _render_page(self, url):
+        """
+        Sayfayı paylaşılan headless tarayıcı havuzunda render eder.
+        Playwright yoksa ya da render başarısız olursa (zaman aşımı, tarayıcı kurulu değil,
+        çökme) None döndürür; çağıran statik içerikle devam eder.
+        """
+        if not renderer.is_available():
+            self.logger.warning("%s JavaScript ile oluşturuluyor ancak Playwright kurulu değil; statik içerik kullanılıyor", url, url=url)
+            return None
+        try:
+            pool = renderer.get_browser_pool(self.settings.render_pool_size, timeout=self.settings.timeout,
+                                             user_agent=self.settings.user_agent)
+            if pool.start_error is not None:
+                # Tarayıcı daha önce başlatılamadı (uyarı o sırada loglandı); beklemeden statik içeriğe dön
+                return None
+            self.scheduler.acquire(url)
+            return pool.render(url)
+        except Exception as e:
+            self.logger.warning("%s render edilemedi, statik içerik kullanılıyor: %s", url, e, url=url)
+            return None
+
+    def _retry_after(self, response):
+        """Retry-After başlığını saniye cinsinden döndürür (yoksa None)."""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        if value.strip().isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
             
-    def _extract_page_info(self, soup, url):
+    @staticmethod
+    def _parse_page(content, url):
+        """
+        HTML'i ayrıştırır; (page_info, temiz metin, istemci tarafı oluşturulmuş olabilir mi) döndürür.
+        Script kontrolü, _get_clean_text script'leri silmeden önce yapılır.
+        """
+        soup = BeautifulSoup(content, 'html.parser')
+        page_info = WebScraper._extract_page_info(soup, url)
+        client_rendered = soup.find('script') is not None
+        return page_info, WebScraper._get_clean_text(soup), client_rendered
+
+    @staticmethod
+    def _extract_page_info(soup, url):
         """Sayfa meta bilgilerini çıkarır."""
         title_tag = soup.find('title')
         page_title = title_tag.get_text(strip=True) if title_tag else "Başlık Bulunamadı"
@@ -79,7 +304,8 @@ class WebScraper:
             'description': description[:300] + '...' if len(description) > 300 else description
         }
         
-    def _get_clean_text(self, soup):
+    @staticmethod
+    def _get_clean_text(soup):
         """Sayfadaki tüm görünür metni temiz bir şekilde alır."""
         # İstenmeyen tag'leri kaldır
         for element in soup(["script", "style", "noscript", "link", "meta", "header", "footer", "nav"]):
@@ -95,30 +321,21 @@ class WebScraper:
         text = re.sub(r'\s+', ' ', text)
         return text
 
-    def _find_matches_in_text(self, text, keyword, case_sensitive, whole_word):
-        """Verilen metin içinde anahtar kelime eşleşmelerini bulur."""
-        matches = []
-        
-        flags = 0 if case_sensitive else re.IGNORECASE
-        
-        if whole_word:
-            # \b kelime sınırı demektir. 'veri' ararken 'verimli' bulmaz.
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-        else:
-            pattern = re.escape(keyword)
-
-        for i, match in enumerate(re.finditer(pattern, text, flags)):
-            start_pos = match.start()
-            end_pos = match.end()
-            
-            # Eşleşmenin etrafından bağlam (context) al
-            context_start = max(0, start_pos - 150)
-            context_end = min(len(text), end_pos + 150)
-            context = text[context_start:context_end].strip()
-            
-            matches.append({
-                'context': context,
-                'position': start_pos,
-                'match_number': i + 1,
-            })
-        return matches
\ No newline at end of file
+    @classmethod
+    def _find_matches_in_text(cls, text, keyword, case_sensitive, whole_word, match_mode=MATCH_EXACT, index=None):
+        """
+        Verilen metin içinde anahtar kelime eşleşmelerini bulur ve MatchStore olarak döndürür.
+        'fuzzy' modunda metin bir kez TextIndex'e dönüştürülür ve eşleşmeler indeks
+        üzerinden bulunur; case_sensitive ve whole_word bu modda dikkate alınmaz.
+        """
+        matches = MatchStore(text)
+
+        if match_mode == cls.MATCH_FUZZY:
+            index = index or TextIndex(text)
+            matches.extend(keyword, index.find(keyword))
+            matches.word_count = len(index.tokens)
+            return matches
+
+        # Derlenmiş matcher önbellekten gelir; seçeneklere göre str.find ya da regex kullanır
+        matches.extend(keyword, get_matcher(keyword, case_sensitive, whole_word).finditer(text))
+        return matches
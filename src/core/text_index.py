@@ -0,0 +1,148 @@
+# src/core/text_index.py
+
+import re
+import unicodedata
+from bisect import bisect_left
+
+WORD_RE = re.compile(r'\w+')
+
+# Türkçe'ye özgü harfleri tek seferde katlar. 'I' -> 'ı' -> 'i' dönüşümü
+# str.lower()'ın İ/I hatasını da ortadan kaldırır.
+_TR_FOLD = str.maketrans({
+    'İ': 'i', 'I': 'i', 'ı': 'i', 'î': 'i', 'Î': 'i',
+    'Ç': 'c', 'ç': 'c', 'Ğ': 'g', 'ğ': 'g', 'Ö': 'o', 'ö': 'o',
+    'Ş': 's', 'ş': 's', 'Ü': 'u', 'ü': 'u', 'Â': 'a', 'â': 'a', 'Û': 'u', 'û': 'u',
+})
+
+# Ünsüz yumuşaması (kitap -> kitabı, renk -> rengi) nedeniyle kök sonunda atılan harfler
+_SOFTENING_FINALS = 'ptk'
+MIN_STEM_LENGTH = 4
+MAX_SUFFIX_LENGTH = 10
+MIN_FUZZY_LENGTH = 5
+
+
+def fold_turkish(word):
+    """Kelimeyi Türkçe kurallarıyla küçültür ve aksanlardan arındırır."""
+    word = word.translate(_TR_FOLD).lower()
+    if word.isascii():
+        return word
+    decomposed = unicodedata.normalize('NFKD', word)
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def stem_turkish(folded):
+    """
+    Katlanmış kelimenin ek almış biçimlerini bulmak için kullanılan önek kökünü döndürür.
+    Türkçe yalnızca sonek aldığından, çekimli biçimler bu kök ile başlar.
+    """
+    if len(folded) > MIN_STEM_LENGTH and folded[-1] in _SOFTENING_FINALS:
+        return folded[:-1]
+    return folded
+
+
+def _deletions(term):
+    """Terimden tek harf silinerek elde edilen varyantlar (edit distance 1 araması için)."""
+    return {term[:i] + term[i + 1:] for i in range(len(term))}
+
+
+def _within_one_edit(a, b):
+    """İki terim arasındaki Levenshtein uzaklığı en fazla 1 mi (ekleme/silme/değiştirme)?"""
+    if len(a) > len(b):
+        a, b = b, a
+    if len(b) - len(a) > 1:
+        return False
+    # Ortak önek ve sonek atıldıktan sonra kalan fark en fazla bir harf olmalı
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        return a[i + 1:] == b[i + 1:]
+    return a[i:] == b[i + 1:]
+
+
+class TextIndex:
+    """
+    Metni bir kez tarayıp katlanmış kelime indeksine dönüştürür.
+    Her kelimenin orijinal metindeki başlangıç/bitiş ofseti saklanır; böylece eşleşmeler
+    indeks üzerinden bulunup bağlam orijinal metinden alınabilir.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.starts = []
+        self.ends = []
+        self.tokens = []   # her kelimenin katlanmış hali
+        self.terms = {}    # katlanmış terim -> kelime sıra numaraları
+
+        fold_cache = {}
+        for match in WORD_RE.finditer(text):
+            word = match.group()
+            folded = fold_cache.get(word)
+            if folded is None:
+                folded = fold_cache[word] = fold_turkish(word)
+            self.terms.setdefault(folded, []).append(len(self.tokens))
+            self.tokens.append(folded)
+            self.starts.append(match.start())
+            self.ends.append(match.end())
+
+        self._sorted_terms = None
+        self._deletion_index = None
+
+    def _prefix_terms(self, prefix):
+        """Verilen önekle başlayan terimleri sıralı sözlükten bulur."""
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self.terms)
+        found = []
+        i = bisect_left(self._sorted_terms, prefix)
+        while i < len(self._sorted_terms) and self._sorted_terms[i].startswith(prefix):
+            term = self._sorted_terms[i]
+            if len(term) - len(prefix) <= MAX_SUFFIX_LENGTH:
+                found.append(term)
+            i += 1
+        return found
+
+    def _similar_terms(self, term):
+        """Terime en fazla bir harf uzaklıktaki (ekleme/silme/değiştirme) terimleri bulur."""
+        if self._deletion_index is None:
+            self._deletion_index = {}
+            for candidate in self.terms:
+                if len(candidate) >= MIN_FUZZY_LENGTH - 1:
+                    for variant in _deletions(candidate) | {candidate}:
+                        self._deletion_index.setdefault(variant, set()).add(candidate)
+        found = set()
+        for variant in _deletions(term) | {term}:
+            found |= self._deletion_index.get(variant, set())
+        # Ortak silme varyantı uzaklığı 2'ye kadar olan çiftleri de getirir (kadar ~ kadro);
+        # yalnızca gerçekten bir harf uzaklıktakiler tutulur
+        return {candidate for candidate in found if _within_one_edit(term, candidate)}
+
+    def candidate_terms(self, folded_word):
+        """Bir anahtar kelime parçasıyla eşleşen tüm sözlük terimlerini döndürür."""
+        found = {folded_word} if folded_word in self.terms else set()
+        stem = stem_turkish(folded_word)
+        if len(stem) >= MIN_STEM_LENGTH:
+            found.update(self._prefix_terms(stem))
+        if len(folded_word) >= MIN_FUZZY_LENGTH:
+            found |= self._similar_terms(folded_word)
+        return found
+
+    def find(self, keyword):
+        """
+        Anahtar kelimenin çekimli, aksansız ve küçük yazım hatalı biçimlerini bulur.
+        (başlangıç, bitiş) ofsetlerini orijinal metne göre döndürür.
+        """
+        parts = [fold_turkish(w) for w in WORD_RE.findall(keyword)]
+        if not parts:
+            return []
+
+        candidates = [self.candidate_terms(part) for part in parts]
+        spans = []
+        first_ids = sorted(i for term in candidates[0] for i in self.terms[term])
+        last = len(parts) - 1
+        for token_id in first_ids:
+            end_id = token_id + last
+            if end_id >= len(self.tokens):
+                break
+            if all(self.tokens[token_id + k] in candidates[k] for k in range(1, len(parts))):
+                spans.append((self.starts[token_id], self.ends[end_id]))
+        return spans
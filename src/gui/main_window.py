@@ -10,20 +10,21 @@ from datetime import datetime
 
 from ..core.scraper import WebScraper
 from ..utils.logger import Logger
-from ..utils.config import Config
+from ..utils.config import get_config
 
 class WorkerThread(QThread):
     """Web scraping işlemini arka planda çalıştıran thread"""
     progress_update = pyqtSignal(str)
     finished = pyqtSignal(bool, str, int)
     
-    def __init__(self, url, keyword, save_path, case_sensitive, whole_word):
+    def __init__(self, url, keyword, save_path, case_sensitive, whole_word, match_mode=WebScraper.MATCH_EXACT):
         super().__init__()
         self.url = url
         self.keyword = keyword
         self.save_path = save_path
         self.case_sensitive = case_sensitive
         self.whole_word = whole_word
+        self.match_mode = match_mode
         self.scraper = WebScraper()
         
     def run(self):
@@ -34,7 +35,8 @@ class WorkerThread(QThread):
             
             pdf_path, match_count = self.scraper.scrape_and_save(
                 self.url, self.keyword, self.save_path,
-                self.case_sensitive, self.whole_word, progress_callback
+                self.case_sensitive, self.whole_word, progress_callback,
+                self.match_mode
             )
             
             self.finished.emit(True, pdf_path, match_count)
@@ -47,7 +49,7 @@ class MainWindow(QMainWindow):
     
     def __init__(self):
         super().__init__()
-        self.config = Config()
+        self.config = get_config()
         self.logger = Logger()
         self.worker_thread = None
         self.init_ui()
@@ -108,13 +110,21 @@ class MainWindow(QMainWindow):
         self.case_sensitive_cb = QCheckBox("Büyük/Küçük Harfe Duyarlı Ara")
         self.whole_word_cb = QCheckBox("Sadece Tam Kelimeyi Eşleştir")
         self.whole_word_cb.setChecked(True) # Genellikle daha iyi sonuç verir
+        self.fuzzy_cb = QCheckBox("Çekimli/Benzer Biçimleri de Bul (Türkçe)")
+        self.fuzzy_cb.toggled.connect(self.toggle_fuzzy)
         
         options_layout.addWidget(self.case_sensitive_cb)
         options_layout.addWidget(self.whole_word_cb)
+        options_layout.addWidget(self.fuzzy_cb)
         options_layout.addStretch()
         
         layout.addWidget(options_group)
         
+    def toggle_fuzzy(self, checked):
+        """Çekimli arama kelime bazlı ve harf duyarsız olduğundan diğer seçenekleri kapatır"""
+        self.case_sensitive_cb.setEnabled(not checked)
+        self.whole_word_cb.setEnabled(not checked)
+        
     def create_buttons_section(self, layout):
         """Butonlar bölümünü oluşturur"""
         buttons_layout = QHBoxLayout()
@@ -176,7 +186,8 @@ class MainWindow(QMainWindow):
         
         self.worker_thread = WorkerThread(
             url, keyword, save_path,
-            self.case_sensitive_cb.isChecked(), self.whole_word_cb.isChecked()
+            self.case_sensitive_cb.isChecked(), self.whole_word_cb.isChecked(),
+            WebScraper.MATCH_FUZZY if self.fuzzy_cb.isChecked() else WebScraper.MATCH_EXACT
         )
         self.worker_thread.progress_update.connect(self.update_progress)
         self.worker_thread.finished.connect(self.scraping_finished)
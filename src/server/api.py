@@ -0,0 +1,346 @@
+# src/server/api.py
+
+import json
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+import uuid
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from ..core.scraper import WebScraper
+from ..utils.logger import Logger
+from ..utils.config import get_settings
+
+
+class AdmissionError(Exception):
+    """İş kabul edilemediğinde (kuyruk dolu / istemci limiti) fırlatılır."""
+
+    def __init__(self, message, status, retry_after=None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class ScanJob:
+    """Tek bir tarama işi; ilerleme olayları akış halinde okunabilir."""
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    def __init__(self, client, url, keyword, case_sensitive, whole_word, match_mode):
+        self.id = uuid.uuid4().hex
+        self.client = client
+        self.url = url
+        self.keyword = keyword
+        self.case_sensitive = case_sensitive
+        self.whole_word = whole_word
+        self.match_mode = match_mode
+        self.status = self.QUEUED
+        self.pdf_path = None
+        self.match_count = None
+        self.error = None
+        self.created = time.time()
+        self.finished = None
+        self.events = []
+        self._cond = threading.Condition()
+
+    @property
+    def is_finished(self):
+        return self.status in (self.DONE, self.FAILED)
+
+    def add_event(self, message):
+        """progress_callback olarak kullanılır; bekleyen akışları uyandırır."""
+        with self._cond:
+            self.events.append({'time': time.time(), 'message': message})
+            self._cond.notify_all()
+
+    def set_status(self, status, **fields):
+        with self._cond:
+            self.status = status
+            for key, value in fields.items():
+                setattr(self, key, value)
+            if self.is_finished:
+                self.finished = time.time()
+            self._cond.notify_all()
+
+    def wait_events(self, since, timeout=15):
+        """since numaralı olaydan sonrakileri döndürür; yeni olay yoksa timeout kadar bekler."""
+        with self._cond:
+            if len(self.events) <= since and not self.is_finished:
+                self._cond.wait(timeout)
+            return self.events[since:], self.is_finished
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'status': self.status,
+            'url': self.url,
+            'keyword': self.keyword,
+            'case_sensitive': self.case_sensitive,
+            'whole_word': self.whole_word,
+            'match_mode': self.match_mode,
+            'match_count': self.match_count,
+            'error': self.error,
+            'created': self.created,
+            'finished': self.finished,
+            'links': {
+                'self': f"/scans/{self.id}",
+                'events': f"/scans/{self.id}/events",
+                'report': f"/scans/{self.id}/report" if self.status == self.DONE else None,
+            },
+        }
+
+
+class JobManager:
+    """
+    Tarama işlerini sınırlı bir kuyruk ve sabit sayıda işçi thread ile yürütür.
+    Tüm işler tek bir WebScraper'ı (HTTP oturumu, hız sınırlayıcı, font kaydı) paylaşır.
+    """
+
+    def __init__(self, settings=None):
+        self.settings = settings or get_settings().server
+        self.logger = Logger()
+        self.scraper = WebScraper()
+        self.jobs = {}
+        self._queue = queue.Queue(maxsize=self.settings.queue_size)
+        self._lock = threading.Lock()
+        self._running = 0
+        os.makedirs(self.settings.report_dir, exist_ok=True)
+
+        self._workers = [
+            threading.Thread(target=self._work, name=f"ScanWorker-{i}", daemon=True)
+            for i in range(self.settings.workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, client, url, keyword, case_sensitive=False, whole_word=False, match_mode=WebScraper.MATCH_EXACT):
+        """Yeni iş oluşturur ve kuyruğa ekler. Kabul edilemezse AdmissionError fırlatır."""
+        with self._lock:
+            self._prune()
+            active = sum(1 for job in self.jobs.values() if job.client == client and not job.is_finished)
+            if active >= self.settings.max_jobs_per_client:
+                raise AdmissionError("Bu istemci için eşzamanlı iş limiti doldu.", HTTPStatus.TOO_MANY_REQUESTS, 5)
+
+            job = ScanJob(client, url, keyword, case_sensitive, whole_word, match_mode)
+            try:
+                self._queue.put_nowait(job)
+            except queue.Full:
+                raise AdmissionError("Sunucu kuyruğu dolu, daha sonra tekrar deneyin.", HTTPStatus.SERVICE_UNAVAILABLE, 10)
+            self.jobs[job.id] = job
+
+        self.logger.info("İş kuyruğa alındı: %s", url, scan_id=job.id, client=client)
+        return job
+
+    def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    def stats(self):
+        return {
+            'queued': self._queue.qsize(),
+            'running': self._running,
+            'workers': len(self._workers),
+            'queue_size': self.settings.queue_size,
+            'jobs': len(self.jobs),
+        }
+
+    def _prune(self):
+        """
+        Süresi dolan bitmiş işleri, raporlarını ve sayfa istatistiklerini temizler
+        (self._lock altında çağrılır). Aynı URL'yi tarayan başka bir iş kaldıysa istatistik korunur.
+        """
+        cutoff = time.time() - self.settings.job_ttl
+        for job_id in [j.id for j in self.jobs.values() if j.is_finished and j.finished < cutoff]:
+            job = self.jobs.pop(job_id)
+            shutil.rmtree(os.path.join(self.settings.report_dir, job_id), ignore_errors=True)
+            if not any(other.url == job.url for other in self.jobs.values()):
+                self.scraper.stats_index.remove(job.url)
+
+    def _work(self):
+        while True:
+            job = self._queue.get()
+            with self._lock:
+                self._running += 1
+            job.set_status(ScanJob.RUNNING)
+            # Her iş kendi alt klasörüne yazar; aynı saniyede üretilen raporlar çakışmaz
+            save_path = os.path.join(self.settings.report_dir, job.id)
+            try:
+                os.makedirs(save_path, exist_ok=True)
+                pdf_path, match_count = self.scraper.scrape_and_save(
+                    job.url, job.keyword, save_path,
+                    job.case_sensitive, job.whole_word, job.add_event,
+                    job.match_mode
+                )
+                job.set_status(ScanJob.DONE, pdf_path=pdf_path, match_count=match_count)
+            except Exception as e:
+                job.set_status(ScanJob.FAILED, error=str(e))
+            finally:
+                with self._lock:
+                    self._running -= 1
+                self._queue.task_done()
+
+
+class ScanRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP uç noktaları:
+      POST /scans                 -> tarama gönder (JSON gövde)
+      GET  /scans/<id>            -> iş durumu
+      GET  /scans/<id>/events     -> ilerleme akışı (Server-Sent Events)
+      GET  /scans/<id>/report     -> PDF raporu
+      GET  /health                -> kuyruk/işçi durumu
+    """
+
+    server_version = 'WebScraperPDF/1.0'
+    manager = None  # run_server tarafından atanır
+    MAX_BODY = 64 * 1024
+    JOB_PATH = re.compile(r'^/scans/([0-9a-f]{32})(/events|/report)?$')
+
+    def do_GET(self):
+        # self.path sorgu dizesini de içerir (/health?x=1); yönlendirme yalnızca yola göre yapılır
+        path = urlsplit(self.path).path
+        if path == '/health':
+            return self._send_json(HTTPStatus.OK, self.manager.stats())
+
+        match = self.JOB_PATH.match(path)
+        job = self.manager.get(match.group(1)) if match else None
+        if job is None:
+            return self._send_error(HTTPStatus.NOT_FOUND, "İş bulunamadı.")
+
+        action = match.group(2)
+        if action == '/events':
+            return self._stream_events(job)
+        if action == '/report':
+            return self._send_report(job)
+        return self._send_json(HTTPStatus.OK, job.to_dict())
+
+    def do_POST(self):
+        if urlsplit(self.path).path != '/scans':
+            return self._send_error(HTTPStatus.NOT_FOUND, "Bilinmeyen adres.")
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            if length < 0:
+                raise ValueError(length)
+            if length > self.MAX_BODY:
+                return self._send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "İstek gövdesi çok büyük.")
+            payload = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            return self._send_error(HTTPStatus.BAD_REQUEST, "Geçerli bir JSON gövdesi gönderin.")
+        if not isinstance(payload, dict):
+            return self._send_error(HTTPStatus.BAD_REQUEST, "JSON gövdesi bir nesne olmalıdır.")
+
+        url = str(payload.get('url', '')).strip()
+        keyword = str(payload.get('keyword', '')).strip()
+        match_mode = payload.get('match_mode', WebScraper.MATCH_EXACT)
+        if not url.startswith(('http://', 'https://')):
+            return self._send_error(HTTPStatus.BAD_REQUEST, "'http://' veya 'https://' ile başlayan geçerli bir URL girin.")
+        if not keyword:
+            return self._send_error(HTTPStatus.BAD_REQUEST, "Aranacak bir anahtar kelime girin.")
+        if match_mode not in (WebScraper.MATCH_EXACT, WebScraper.MATCH_FUZZY):
+            return self._send_error(HTTPStatus.BAD_REQUEST, "match_mode 'exact' ya da 'fuzzy' olmalıdır.")
+        case_sensitive = payload.get('case_sensitive', False)
+        whole_word = payload.get('whole_word', False)
+        # "false" gibi string değerler bool() ile True'ya döner; yalnızca JSON boolean kabul edilir
+        for name, value in (('case_sensitive', case_sensitive), ('whole_word', whole_word)):
+            if not isinstance(value, bool):
+                return self._send_error(HTTPStatus.BAD_REQUEST, f"{name} true ya da false olmalıdır.")
+
+        try:
+            job = self.manager.submit(
+                self.client_address[0], url, keyword,
+                case_sensitive, whole_word, match_mode,
+            )
+        except AdmissionError as e:
+            return self._send_error(e.status, str(e), {'Retry-After': str(e.retry_after)})
+
+        self._send_json(HTTPStatus.ACCEPTED, job.to_dict(), {'Location': f"/scans/{job.id}"})
+
+    def _stream_events(self, job):
+        """İlerleme mesajlarını iş bitene kadar Server-Sent Events olarak gönderir."""
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+
+        sent = 0
+        try:
+            while True:
+                events, finished = job.wait_events(sent)
+                for event in events:
+                    sent += 1
+                    self._write_event('progress', event, sent)
+                if finished:
+                    self._write_event(job.status, job.to_dict(), sent + 1)
+                    return
+                if not events:
+                    # Bağlantıyı canlı tutmak için yorum satırı
+                    self.wfile.write(b': keep-alive\n\n')
+                    self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _write_event(self, name, data, event_id):
+        message = f"id: {event_id}\nevent: {name}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+        self.wfile.write(message.encode('utf-8'))
+        self.wfile.flush()
+
+    def _send_report(self, job):
+        if job.status != ScanJob.DONE:
+            return self._send_error(HTTPStatus.CONFLICT, f"Rapor hazır değil (durum: {job.status}).")
+        try:
+            size = os.path.getsize(job.pdf_path)
+            with open(job.pdf_path, 'rb') as f:
+                self.send_response(HTTPStatus.OK)
+                self.send_header('Content-Type', 'application/pdf')
+                self.send_header('Content-Length', str(size))
+                self.send_header('Content-Disposition', f'attachment; filename="{os.path.basename(job.pdf_path)}"')
+                self.end_headers()
+                while True:
+                    chunk = f.read(64 * 1024)
+                    if not chunk:
+                        break
+                    self.wfile.write(chunk)
+        except FileNotFoundError:
+            self._send_error(HTTPStatus.GONE, "Rapor dosyası artık mevcut değil.")
+
+    def _send_json(self, status, data, headers=None):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status, message, headers=None):
+        self._send_json(status, {'error': message}, headers)
+
+    def log_message(self, format, *args):
+        """Erişim loglarını uygulama logger'ına yönlendirir."""
+        self.manager.logger.debug("%s - " + format, self.client_address[0], *args)
+
+
+def run_server(host=None, port=None):
+    """Sunucuyu başlatır ve kapatılana kadar istekleri işler."""
+    settings = get_settings().server
+    host = host or settings.host
+    port = port or settings.port
+
+    ScanRequestHandler.manager = JobManager(settings)
+    httpd = ThreadingHTTPServer((host, port), ScanRequestHandler)
+    httpd.daemon_threads = True
+    ScanRequestHandler.manager.logger.info("Sunucu başlatıldı: http://%s:%d", host, port)
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
@@ -4,65 +4,216 @@ Uygulama konfigürasyonu
 
 import os
 import json
+import atexit
+import tempfile
+import threading
+from dataclasses import dataclass, field, fields, asdict, replace
 from pathlib import Path
 
+# Ortam değişkeni ile geçersiz kılma: WEBSCRAPER_<BÖLÜM>__<ANAHTAR>=değer
+# Örn: WEBSCRAPER_SCRAPER__TIMEOUT=10, WEBSCRAPER_LOGGING__FORMAT=json
+ENV_PREFIX = 'WEBSCRAPER_'
+
+# set() çağrılarının diske yazılmadan önce biriktirildiği süre (saniye)
+SAVE_DELAY = 0.5
+
+# Config dosyası şema sürümü; sürümü olmayan dosyalar 1 kabul edilir
+CONFIG_VERSION = 2
+
+# Eski sürümlerin dosyaya yazdığı varsayılanlar. Kullanıcı bunları değiştirmediyse
+# yeni varsayılanların geçerli olması için taşıma sırasında silinirler.
+_LEGACY_DEFAULTS = {
+    1: {'pdf': {'margin_bottom': 18, 'highlight_color': 'red'}},
+}
+
+
+def _setting(default, **rules):
+    """Varsayılan değer ve doğrulama kuralları (min, max, choices, color) ile alan tanımlar."""
+    return field(default=default, metadata=rules)
+
+
+@dataclass(frozen=True)
+class AppSettings:
+    name: str = 'Web Scraper PDF Generator'
+    version: str = '1.0.0'
+    author: str = 'WebScraper Team'
+
+
+@dataclass(frozen=True)
+class ScraperSettings:
+    timeout: float = _setting(30.0, min=1)
+    max_retries: int = _setting(3, min=0, max=10)
+    user_agent: str = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    context_length: int = _setting(300, min=0)
+    requests_per_second: float = _setting(2.0, min=0.01)
+    burst: int = _setting(4, min=1)
+    backoff_factor: float = _setting(0.5, min=0.05, max=1)
+    max_workers: int = _setting(8, min=1)
+    render_mode: str = _setting('auto', choices=('off', 'auto', 'always'))
+    render_pool_size: int = _setting(2, min=1)
+
+
+@dataclass(frozen=True)
+class PDFSettings:
+    page_size: str = _setting('A4', choices=('A3', 'A4', 'A5', 'LETTER', 'LEGAL'))
+    margin_top: int = _setting(72, min=0)
+    margin_bottom: int = _setting(72, min=0)
+    margin_left: int = _setting(72, min=0)
+    margin_right: int = _setting(72, min=0)
+    font_size: int = _setting(10, min=6, max=24)
+    highlight_color: str = _setting('#e74c3c', color=True)
+
+
+@dataclass(frozen=True)
+class LoggingSettings:
+    level: str = _setting('INFO', choices=('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'))
+    format: str = _setting('text', choices=('text', 'json'))
+    backup_count: int = _setting(14, min=0)
+    batch_size: int = _setting(64, min=1)
+
+
+@dataclass(frozen=True)
+class UISettings:
+    theme: str = 'default'
+    window_width: int = _setting(1000, min=400)
+    window_height: int = _setting(700, min=300)
+    default_save_path: str = field(default_factory=lambda: str(Path.home() / 'Desktop'))
+
+
+@dataclass(frozen=True)
+class ServerSettings:
+    host: str = '127.0.0.1'
+    port: int = _setting(8765, min=1, max=65535)
+    workers: int = _setting(4, min=1)
+    queue_size: int = _setting(32, min=1)
+    max_jobs_per_client: int = _setting(4, min=1)
+    job_ttl: int = _setting(3600, min=60)
+    report_dir: str = field(default_factory=lambda: str(Path.home() / '.webscraper' / 'reports'))
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Doğrulanmış, değiştirilemez ayarlar. Sıcak yollarda doğrudan öznitelik olarak okunur."""
+    app: AppSettings = field(default_factory=AppSettings)
+    scraper: ScraperSettings = field(default_factory=ScraperSettings)
+    pdf: PDFSettings = field(default_factory=PDFSettings)
+    logging: LoggingSettings = field(default_factory=LoggingSettings)
+    ui: UISettings = field(default_factory=UISettings)
+    server: ServerSettings = field(default_factory=ServerSettings)
+
+
+def _coerce(value, target_type):
+    """Değeri alan tipine çevirir (ortam değişkenleri her zaman string gelir)."""
+    if isinstance(value, target_type) and not isinstance(value, bool):
+        return value
+    if target_type is bool:
+        return str(value).strip().lower() in ('1', 'true', 'yes', 'on', 'evet')
+    return target_type(value)
+
+
+def _is_valid_color(value):
+    """Değerin ReportLab tarafından renk olarak tanınıp tanınmadığını kontrol eder."""
+    try:
+        from reportlab.lib.colors import toColor
+    except ImportError:  # ReportLab yoksa PDF de üretilemez; doğrulama atlanır
+        return True
+    try:
+        toColor(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _build_section(section_cls, values, errors):
+    """Bir bölümü sözlükten oluşturur; geçersiz değerler varsayılana döner ve errors'a eklenir."""
+    section = section_cls()
+    if not isinstance(values, dict):
+        return section
+    changes = {}
+    for f in fields(section_cls):
+        if f.name not in values:
+            continue
+        key = f"{section_cls.__name__}.{f.name}"
+        try:
+            value = _coerce(values[f.name], f.type)
+        except (TypeError, ValueError):
+            errors.append(f"{key}: '{values[f.name]}' {f.type.__name__} tipine çevrilemedi")
+            continue
+        rules = f.metadata
+        if 'choices' in rules and isinstance(value, str):
+            # Seçenekler büyük/küçük harf duyarsız kabul edilir ('debug' -> 'DEBUG')
+            value = next((c for c in rules['choices'] if c.lower() == value.lower()), value)
+        if 'choices' in rules and value not in rules['choices']:
+            errors.append(f"{key}: '{value}' geçersiz, seçenekler: {', '.join(rules['choices'])}")
+        elif 'min' in rules and value < rules['min']:
+            errors.append(f"{key}: {value} en az {rules['min']} olmalı")
+        elif 'max' in rules and value > rules['max']:
+            errors.append(f"{key}: {value} en fazla {rules['max']} olabilir")
+        elif rules.get('color') and not _is_valid_color(value):
+            errors.append(f"{key}: '{value}' geçerli bir renk değil")
+        else:
+            changes[f.name] = value
+    return replace(section, **changes)
+
+
 class Config:
     """Uygulama konfigürasyon sınıfı"""
-    
+
     def __init__(self):
         self.config_file = self._get_config_file()
         self.config = self._load_config()
-        
+        self._lock = threading.RLock()
+        self._cache = {}
+        self._save_timer = None
+        self.validation_errors = []
+        self.settings = self._build_settings()
+        atexit.register(self.flush)
+
     def _get_config_file(self):
         """Config dosyasının yolunu döndürür"""
         config_dir = Path.home() / '.webscraper'
         config_dir.mkdir(exist_ok=True)
         return config_dir / 'config.json'
-        
+
     def _load_config(self):
         """Config dosyasını yükler"""
-        default_config = {
-            'app': {
-                'name': 'Web Scraper PDF Generator',
-                'version': '1.0.0',
-                'author': 'WebScraper Team'
-            },
-            'scraper': {
-                'timeout': 30,
-                'max_retries': 3,
-                'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'context_length': 300
-            },
-            'pdf': {
-                'page_size': 'A4',
-                'margin_top': 72,
-                'margin_bottom': 18,
-                'margin_left': 72,
-                'margin_right': 72,
-                'font_size': 10,
-                'highlight_color': 'red'
-            },
-            'ui': {
-                'theme': 'default',
-                'window_width': 1000,
-                'window_height': 700,
-                'default_save_path': str(Path.home() / 'Desktop')
-            }
-        }
-        
+        default_config = {'config_version': CONFIG_VERSION, **asdict(Settings())}
+
         if self.config_file.exists():
             try:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     config = json.load(f)
-                    # Eksik anahtarları varsayılan değerlerle doldur
-                    return self._merge_config(default_config, config)
+                migrated = self._migrate_config(config)
+                # Eksik anahtarları varsayılan değerlerle doldur
+                config = self._merge_config(default_config, config)
+                if migrated:
+                    self._save_config(config)
+                return config
             except Exception:
                 pass
-        
+
         # Varsayılan config'i kaydet
         self._save_config(default_config)
         return default_config
-        
+
+    def _migrate_config(self, config):
+        """Eski sürüm config'i yerinde günceller; değişiklik yapıldıysa True döndürür."""
+        version = config.get('config_version', 1)
+        if version >= CONFIG_VERSION:
+            return False
+        for old_version, sections in _LEGACY_DEFAULTS.items():
+            if version > old_version:
+                continue
+            for section, values in sections.items():
+                user_section = config.get(section)
+                if not isinstance(user_section, dict):
+                    continue
+                for key, old_default in values.items():
+                    if user_section.get(key) == old_default:
+                        del user_section[key]
+        config['config_version'] = CONFIG_VERSION
+        return True
+
     def _merge_config(self, default, user):
         """Kullanıcı ve varsayılan config'i birleştirir"""
         result = default.copy()
@@ -72,17 +223,53 @@ class Config:
             else:
                 result[key] = value
         return result
-        
+
+    def _env_overrides(self):
+        """WEBSCRAPER_<BÖLÜM>__<ANAHTAR> ortam değişkenlerini config sözlüğü olarak döndürür."""
+        overrides = {}
+        for name, value in os.environ.items():
+            if name.startswith(ENV_PREFIX) and '__' in name:
+                section, key = name[len(ENV_PREFIX):].lower().split('__', 1)
+                overrides.setdefault(section, {})[key] = value
+        return overrides
+
+    def _build_settings(self):
+        """Dosya + ortam değişkenlerinden doğrulanmış Settings nesnesi oluşturur."""
+        values = self._merge_config(self.config, self._env_overrides())
+        errors = []
+        settings = Settings(**{
+            f.name: _build_section(f.type, values.get(f.name, {}), errors)
+            for f in fields(Settings)
+        })
+        self.validation_errors = errors
+        return settings
+
     def _save_config(self, config):
-        """Config'i dosyaya kaydeder"""
+        """Config'i dosyaya atomik olarak kaydeder (geçici dosya + os.replace)"""
+        tmp_path = None
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.config_file.parent), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
                 json.dump(config, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.config_file)
         except Exception:
-            pass
-            
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def flush(self):
+        """Bekleyen kaydı hemen diske yazar"""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+                self._save_config(self.config)
+
     def get(self, key, default=None):
-        """Config değerini getirir"""
+        """Config değerini getirir (sonuç önbelleğe alınır)"""
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
         keys = key.split('.')
         value = self.config
         for k in keys:
@@ -90,31 +277,58 @@ class Config:
                 value = value[k]
             else:
                 return default
+        self._cache[key] = value
         return value
-        
+
     def set(self, key, value):
-        """Config değerini ayarlar"""
-        keys = key.split('.')
-        config = self.config
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
-        config[keys[-1]] = value
-        self._save_config(self.config)
-        
+        """Config değerini ayarlar; kayıt kısa bir gecikmeyle toplu yapılır"""
+        with self._lock:
+            keys = key.split('.')
+            config = self.config
+            for k in keys[:-1]:
+                if k not in config:
+                    config[k] = {}
+                config = config[k]
+            config[keys[-1]] = value
+            self._cache.clear()
+            self.settings = self._build_settings()
+
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
     def get_app_info(self):
         """Uygulama bilgilerini döndürür"""
         return self.config.get('app', {})
-        
+
     def get_scraper_settings(self):
         """Scraper ayarlarını döndürür"""
         return self.config.get('scraper', {})
-        
+
     def get_pdf_settings(self):
         """PDF ayarlarını döndürür"""
         return self.config.get('pdf', {})
-        
+
     def get_ui_settings(self):
         """UI ayarlarını döndürür"""
-        return self.config.get('ui', {})
\ No newline at end of file
+        return self.config.get('ui', {})
+
+
+_shared_config = None
+_shared_config_lock = threading.Lock()
+
+
+def get_config():
+    """Süreç genelinde paylaşılan Config örneğini döndürür (dosya yalnızca bir kez okunur)."""
+    global _shared_config
+    with _shared_config_lock:
+        if _shared_config is None:
+            _shared_config = Config()
+        return _shared_config
+
+
+def get_settings():
+    """Paylaşılan Config'in güncel, doğrulanmış ayarlarını döndürür."""
+    return get_config().settings
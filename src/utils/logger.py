@@ -2,66 +2,232 @@
 Loglama sistemi
 """
 
+import atexit
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import time
+from contextlib import contextmanager
 from datetime import datetime
 
+from .config import get_config
+
+# LogRecord'un standart alanları; bunların dışındakiler yapılandırılmış alan kabul edilir
+_RECORD_FIELDS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+# Süreç başına isim -> QueueListener; çıkışta kuyruktakiler diske yazılır
+_listeners = {}
+
+
+class JsonFormatter(logging.Formatter):
+    """Her kaydı tek satırlık JSON olarak yazar (scan_id, stage, elapsed_ms vb. alanlarla)."""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_FIELDS:
+                entry[key] = value
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class BatchingFileHandler(logging.handlers.TimedRotatingFileHandler):
+    """
+    Günlük döndürülen ve diske toplu yazan dosya handler'ı.
+    StreamHandler her kayıttan sonra flush çağırır; burada flush yalnızca
+    batch dolduğunda, süre aşıldığında ya da WARNING ve üzeri kayıtlarda yapılır.
+    """
+
+    def __init__(self, filename, backup_count=14, batch_size=64, flush_interval=1.0):
+        super().__init__(filename, when='midnight', backupCount=backup_count, encoding='utf-8', delay=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._force = False
+
+    def emit(self, record):
+        self._force = record.levelno >= logging.WARNING
+        super().emit(record)
+
+    def flush(self):
+        self._pending += 1
+        if (self._force or self._pending >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.force_flush()
+
+    def force_flush(self):
+        """Tampondaki kayıtları diske yazar."""
+        super().flush()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def close(self):
+        self.acquire()
+        try:
+            if self.stream:
+                self.force_flush()
+        finally:
+            self.release()
+        super().close()
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """
+    Kuyruk flush_interval boyunca boş kaldığında tamponlu handler'ları diske yazan listener.
+    BatchingFileHandler yalnızca yeni kayıt geldiğinde süreyi kontrol edebilir; boşta
+    kalan bir logger'ın son kayıtları bu sayede beklemeden dosyaya düşer.
+    """
+
+    def __init__(self, queue, *handlers, respect_handler_level=False, flush_interval=1.0):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self.flush_interval = flush_interval
+
+    def dequeue(self, block):
+        if not block:
+            return super().dequeue(block)
+        while True:
+            try:
+                return self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._flush_idle()
+
+    def _flush_idle(self):
+        for handler in self.handlers:
+            if getattr(handler, '_pending', 0):
+                handler.acquire()
+                try:
+                    handler.force_flush()
+                finally:
+                    handler.release()
+
+
+def _stop_listeners():
+    for listener in _listeners.values():
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+    _listeners.clear()
+
+
+atexit.register(_stop_listeners)
+
+
 class Logger:
-    """Uygulama için loglama sınıfı"""
-    
+    """
+    Uygulama için loglama sınıfı.
+    Kayıtlar kuyruğa bırakılır; dosya/konsol yazımı ayrı bir thread'de (QueueListener) yapılır.
+    """
+
     def __init__(self, name="WebScraper", log_file=None):
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.DEBUG)
-        
+        self.context = {}
+
         # Eğer handler zaten varsa tekrar ekleme
         if not self.logger.handlers:
             self._setup_handlers(log_file)
-            
+
     def _setup_handlers(self, log_file):
         """Log handler'larını kurar"""
-        
+        config = get_config()
+        settings = config.settings.logging
+        self.logger.setLevel(settings.level)
+        self.logger.propagate = False
+
         # Formatter
         formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
-        
+
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
-        
+
         # File handler
         if log_file is None:
             # Logs klasörü oluştur
             logs_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'logs')
             if not os.path.exists(logs_dir):
                 os.makedirs(logs_dir)
-            
-            log_file = os.path.join(logs_dir, f"webscraper_{datetime.now().strftime('%Y%m%d')}.log")
-        
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+
+            log_file = os.path.join(logs_dir, 'webscraper.log')
+
+        file_handler = BatchingFileHandler(
+            log_file,
+            backup_count=settings.backup_count,
+            batch_size=settings.batch_size,
+        )
         file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
-        
-    def debug(self, message):
+        file_handler.setFormatter(JsonFormatter() if settings.format == 'json' else formatter)
+
+        # Çağıran thread yalnızca kuyruğa yazar; disk işlemleri listener thread'inde
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        listener = BatchingQueueListener(
+            log_queue, console_handler, file_handler,
+            respect_handler_level=True, flush_interval=file_handler.flush_interval
+        )
+        listener.start()
+        _listeners[self.logger.name] = listener
+
+        # Geçersiz config değerleri varsayılanlarla değiştirildi; kullanıcıyı bilgilendir
+        for error in config.validation_errors:
+            self.logger.warning("Geçersiz ayar, varsayılan kullanılıyor: %s", error)
+
+    def bind(self, **fields):
+        """Her kayda eklenecek alanlarla (ör. scan_id) yeni bir Logger döndürür."""
+        bound = object.__new__(Logger)
+        bound.logger = self.logger
+        bound.context = {**self.context, **fields}
+        return bound
+
+    def is_enabled_for(self, level):
+        """Seviye kontrolü; pahalı mesajları oluşturmadan önce kullanılır."""
+        return self.logger.isEnabledFor(level)
+
+    @contextmanager
+    def stage(self, name, level=logging.DEBUG, **fields):
+        """Bir aşamanın süresini ölçer ve stage/elapsed_ms alanlarıyla loglar."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self.logger.isEnabledFor(level):
+                elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+                self._log(level, "%s tamamlandı (%.2f ms)", (name, elapsed_ms),
+                          {'stage': name, 'elapsed_ms': elapsed_ms, **fields})
+
+    def _log(self, level, message, args, fields):
+        if self.logger.isEnabledFor(level):
+            extra = {**self.context, **fields} if (self.context or fields) else None
+            self.logger.log(level, message, *args, extra=extra)
+
+    def debug(self, message, *args, **fields):
         """Debug seviyesinde log"""
-        self.logger.debug(message)
-        
-    def info(self, message):
+        self._log(logging.DEBUG, message, args, fields)
+
+    def info(self, message, *args, **fields):
         """Info seviyesinde log"""
-        self.logger.info(message)
-        
-    def warning(self, message):
+        self._log(logging.INFO, message, args, fields)
+
+    def warning(self, message, *args, **fields):
         """Warning seviyesinde log"""
-        self.logger.warning(message)
-        
-    def error(self, message):
+        self._log(logging.WARNING, message, args, fields)
+
+    def error(self, message, *args, **fields):
         """Error seviyesinde log"""
-        self.logger.error(message)
-        
-    def critical(self, message):
+        self._log(logging.ERROR, message, args, fields)
+
+    def critical(self, message, *args, **fields):
         """Critical seviyesinde log"""
-        self.logger.critical(message)
\ No newline at end of file
+        self._log(logging.CRITICAL, message, args, fields)
@@ -3,7 +3,7 @@
 import os
 import re
 from datetime import datetime
-from reportlab.lib.pagesizes import A4
+from reportlab.lib import pagesizes
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
@@ -11,6 +11,9 @@ from reportlab.lib.colors import HexColor, black
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.graphics.shapes import Drawing
+from reportlab.graphics.charts.barcharts import VerticalBarChart
+from .config import get_settings
 
 class PDFGenerator:
     """
@@ -19,6 +22,8 @@ class PDFGenerator:
     """
     
     def __init__(self):
+        self.settings = get_settings().pdf
+        self.page_size = getattr(pagesizes, self.settings.page_size)
         self._register_fonts()
         self.styles = getSampleStyleSheet()
         self._create_custom_styles()
@@ -69,17 +74,18 @@ class PDFGenerator:
             textColor=HexColor('#34495e'),
             alignment=TA_LEFT,
         )
+        font_size = self.settings.font_size
         self.info_style = ParagraphStyle(
             'InfoStyle',
             fontName='DejaVuSans',
-            fontSize=10,
-            leading=14
+            fontSize=font_size,
+            leading=font_size * 1.4
         )
         self.match_style = ParagraphStyle(
             'MatchStyle',
             fontName='DejaVuSans',
-            fontSize=10,
-            leading=15,
+            fontSize=font_size,
+            leading=font_size * 1.5,
             spaceAfter=20,
             leftIndent=20,
             rightIndent=20,
@@ -90,30 +96,42 @@ class PDFGenerator:
             backColor=HexColor('#f9f9f9')
         )
 
-    def create_pdf(self, matches, keyword, page_info, save_path, case_sensitive, whole_word):
-        """PDF dosyasını oluşturur."""
+    def create_pdf(self, matches, keyword, page_info, save_path, case_sensitive, whole_word, match_mode='exact',
+                   name_suffix=None):
+        """
+        PDF dosyasını oluşturur.
+        matches bir MatchStore'dur; bağlamlar yalnızca rapor yazılırken metinden kesilir.
+        name_suffix, aynı saniyede üretilen raporların (toplu tarama) çakışmaması için dosya adına eklenir.
+        """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         safe_keyword = re.sub(r'[^\w\s-]', '', keyword).strip().replace(' ', '_')
-        filename = f"Rapor_{safe_keyword}_{timestamp}.pdf"
+        filename = f"Rapor_{safe_keyword}_{timestamp}"
+        if name_suffix:
+            filename += '_' + re.sub(r'[^\w-]+', '_', name_suffix).strip('_')
+        filename += '.pdf'
         pdf_path = os.path.join(save_path, filename)
         
-        doc = SimpleDocTemplate(pdf_path, pagesize=A4, topMargin=inch, bottomMargin=inch, leftMargin=inch, rightMargin=inch)
+        doc = SimpleDocTemplate(
+            pdf_path, pagesize=self.page_size,
+            topMargin=self.settings.margin_top, bottomMargin=self.settings.margin_bottom,
+            leftMargin=self.settings.margin_left, rightMargin=self.settings.margin_right,
+        )
         story = []
 
         story.append(Paragraph("Web Sitesi Anahtar Kelime Raporu", self.title_style))
         story.append(Spacer(1, 15))
         
-        story.extend(self._create_info_section(page_info, keyword, len(matches), case_sensitive, whole_word))
+        story.extend(self._create_info_section(page_info, keyword, len(matches), case_sensitive, whole_word, match_mode))
         
         if matches:
-            story.extend(self._create_matches_section(matches, keyword, case_sensitive))
+            story.extend(self._create_matches_section(matches, keyword))
         else:
             story.append(Paragraph("Belirtilen anahtar kelime için sayfada eşleşme bulunamadı.", self.info_style))
 
         doc.build(story)
         return pdf_path
 
-    def _create_info_section(self, page_info, keyword, match_count, case_sensitive, whole_word):
+    def _create_info_section(self, page_info, keyword, match_count, case_sensitive, whole_word, match_mode='exact'):
         """Bilgi bölümünü oluşturur."""
         content = [Paragraph("Tarama Özeti", self.subtitle_style), Spacer(1, 10)]
         
@@ -122,6 +140,11 @@ class PDFGenerator:
         url = self._escape_html(page_info.get('url', 'URL Bilgisi Yok'))
         description = self._escape_html(page_info.get('description', 'Açıklama Yok'))
 
+        if match_mode == 'fuzzy':
+            match_type = 'Çekimli/Benzer (Türkçe)'
+        else:
+            match_type = 'Tam Kelime' if whole_word else 'İçinde Geçen'
+
         info_data = [
             [Paragraph('<b>Sayfa Başlığı:</b>', self.info_style), Paragraph(title, self.info_style)],
             [Paragraph('<b>URL:</b>', self.info_style), Paragraph(f'<a href="{url}" color="blue">{url}</a>', self.info_style)],
@@ -129,9 +152,16 @@ class PDFGenerator:
             [Paragraph('<b>Aranan Kelime:</b>', self.info_style), Paragraph(self._escape_html(keyword), self.info_style)],
             [Paragraph('<b>Bulunan Eşleşme Sayısı:</b>', self.info_style), Paragraph(str(match_count), self.info_style)],
             [Paragraph('<b>Büyük/Küçük Harf:</b>', self.info_style), Paragraph('Duyarlı' if case_sensitive else 'Duyarsız', self.info_style)],
-            [Paragraph('<b>Eşleştirme Türü:</b>', self.info_style), Paragraph('Tam Kelime' if whole_word else 'İçinde Geçen', self.info_style)],
+            [Paragraph('<b>Eşleştirme Türü:</b>', self.info_style), Paragraph(match_type, self.info_style)],
             [Paragraph('<b>Rapor Tarihi:</b>', self.info_style), Paragraph(datetime.now().strftime('%d.%m.%Y %H:%M:%S'), self.info_style)],
         ]
+
+        stats = page_info.get('stats')
+        if stats is not None:
+            info_data[5:5] = [
+                [Paragraph('<b>Toplam Kelime:</b>', self.info_style), Paragraph(f"{stats.word_count:,}".replace(',', '.'), self.info_style)],
+                [Paragraph('<b>Anahtar Kelime Yoğunluğu:</b>', self.info_style), Paragraph(f"%{stats.density * 100:.3f} ({stats.density * 1000:.2f} / 1000 kelime)", self.info_style)],
+            ]
         
         table = Table(info_data, colWidths=[2.2*inch, 4.3*inch])
         table.setStyle(TableStyle([
@@ -144,36 +174,95 @@ class PDFGenerator:
         
         content.append(table)
         content.append(Spacer(1, 20))
+
+        if stats is not None and stats.match_count:
+            content.extend(self._create_stats_section(stats))
+        return content
+
+    def _create_stats_section(self, stats):
+        """Konum dağılımı grafiği ve birlikte geçen terimler tablosunu oluşturur."""
+        content = [Paragraph("Sayfa İstatistikleri", self.subtitle_style)]
+
+        content.append(Paragraph("Eşleşmelerin sayfa içindeki konum dağılımı (metnin başından sonuna):", self.info_style))
+        content.append(self._create_histogram_chart(stats.histogram))
+        content.append(Spacer(1, 10))
+
+        if stats.top_terms:
+            content.append(Paragraph("Anahtar kelimeyle en sık birlikte geçen terimler:", self.info_style))
+            content.append(Spacer(1, 6))
+            # İki sütun çifti halinde: Terim | Sayı | Terim | Sayı
+            half = (len(stats.top_terms) + 1) // 2
+            left, right = stats.top_terms[:half], stats.top_terms[half:]
+            rows = [[Paragraph('<b>Terim</b>', self.info_style), Paragraph('<b>Sayı</b>', self.info_style)] * 2]
+            for i in range(half):
+                row = [Paragraph(self._escape_html(left[i][0]), self.info_style), Paragraph(str(left[i][1]), self.info_style)]
+                if i < len(right):
+                    row += [Paragraph(self._escape_html(right[i][0]), self.info_style), Paragraph(str(right[i][1]), self.info_style)]
+                else:
+                    row += ['', '']
+                rows.append(row)
+            table = Table(rows, colWidths=[2.25*inch, 1*inch] * 2)
+            table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), HexColor('#f0f0f0')),
+                ('GRID', (0, 0), (-1, -1), 1, HexColor('#dddddd')),
+                ('TOPPADDING', (0,0), (-1,-1), 4),
+                ('BOTTOMPADDING', (0,0), (-1,-1), 4),
+            ]))
+            content.append(table)
+
+        content.append(Spacer(1, 20))
         return content
 
-    def _create_matches_section(self, matches, keyword, case_sensitive):
-        """Eşleşmeler bölümünü oluşturur."""
+    def _create_histogram_chart(self, histogram):
+        """Konum histogramı için küçük bir sütun grafiği oluşturur."""
+        width, height = 6.5*inch, 1.6*inch
+        drawing = Drawing(width, height)
+        chart = VerticalBarChart()
+        chart.x, chart.y = 30, 20
+        chart.width, chart.height = width - 40, height - 30
+        chart.data = [histogram]
+        chart.categoryAxis.categoryNames = [f"%{i * 100 // len(histogram)}" for i in range(len(histogram))]
+        chart.valueAxis.valueMin = 0
+        chart.valueAxis.valueStep = max(1, -(-max(histogram) // 4))
+        for axis in (chart.categoryAxis, chart.valueAxis):
+            axis.labels.fontName = 'DejaVuSans'
+            axis.labels.fontSize = 7
+        chart.bars[0].fillColor = HexColor('#3498db')
+        chart.bars[0].strokeColor = None
+        drawing.add(chart)
+        return drawing
+
+    def _create_matches_section(self, matches, keyword):
+        """Eşleşmeler bölümünü oluşturur. Çakışan bağlam pencereleri tek kutuda gösterilir."""
         content = [Paragraph("Bulunan Eşleşmeler", self.subtitle_style), Spacer(1, 10)]
         
-        for i, match in enumerate(matches):
-            context = self._highlight_keyword(match['context'], keyword, case_sensitive)
+        match_number = 1
+        for window_start, window_end, spans in matches.windows(keyword):
+            context = self._highlight_spans(matches.text, window_start, window_end, spans)
             # Match number'ı kalın ve mavi yap
-            match_header = f"<b><font color='#3498db'>Eşleşme #{i+1}</font></b> (Pozisyon: {match['position']})"
+            if len(spans) == 1:
+                label = f"Eşleşme #{match_number}"
+            else:
+                label = f"Eşleşme #{match_number}-{match_number + len(spans) - 1}"
+            match_header = f"<b><font color='#3498db'>{label}</font></b> (Pozisyon: {spans[0][0]})"
             content.append(Paragraph(match_header, self.info_style))
             # Asıl eşleşmeyi kutu içinde göster
             content.append(Paragraph(f"...{context}...", self.match_style))
+            match_number += len(spans)
             
         return content
 
-    def _highlight_keyword(self, text, keyword, case_sensitive):
-        """Metinde anahtar kelimeyi <font> etiketi ile vurgular."""
-        text = self._escape_html(text)
-        flags = 0 if case_sensitive else re.IGNORECASE
-        pattern = re.escape(keyword)
-        
-        # Kelimenin kendisini kırmızı ve kalın yap
-        highlighted_text = re.sub(
-            f'({pattern})',
-            r'<font color="#e74c3c"><b>\1</b></font>',
-            text,
-            flags=flags
-        )
-        return highlighted_text
+    def _highlight_spans(self, text, window_start, window_end, spans):
+        """Pencere içindeki eşleşmeleri ofsetlerine göre <font> etiketi ile vurgular."""
+        parts = []
+        cursor = window_start
+        for start, end in spans:
+            parts.append(self._escape_html(text[cursor:start]))
+            # Kelimenin kendisini kırmızı ve kalın yap
+            parts.append(f'<font color="{self.settings.highlight_color}"><b>{self._escape_html(text[start:end])}</b></font>')
+            cursor = end
+        parts.append(self._escape_html(text[cursor:window_end]))
+        return ''.join(parts).strip()
 
     def _escape_html(self, text):
         """ReportLab Paragraph için temel HTML karakterlerini escape eder."""
@@ -0,0 +1,42 @@
+import os
+import sys
+
+import pytest
+
+# Proje dizinini sys.path'e ekle (main.py ile aynı şekilde)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils import config  # noqa: E402
+from src.utils.logger import Logger  # noqa: E402
+
+
+def _use_home(monkeypatch, home):
+    """Config dosyasını geçici ev dizinine yönlendirir ve ortamdan gelen ayarları temizler."""
+    monkeypatch.setenv('HOME', str(home))
+    monkeypatch.setenv('USERPROFILE', str(home))
+    for name in list(os.environ):
+        if name.startswith(config.ENV_PREFIX):
+            monkeypatch.delenv(name)
+    monkeypatch.setattr(config, '_shared_config', None)
+
+
+@pytest.fixture(scope='session', autouse=True)
+def isolated_logger(tmp_path_factory):
+    """
+    Uygulama logger'ını oturum başında geçici bir dosyayla kurar; sonraki Logger()
+    çağrıları mevcut handler'ları kullandığından proje içindeki logs/ klasörüne yazılmaz.
+    """
+    home = tmp_path_factory.mktemp('home')
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        _use_home(monkeypatch, home)
+        Logger(log_file=str(home / 'webscraper.log'))
+        yield
+
+
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path, monkeypatch):
+    """Her test kendi ~/.webscraper/config.json dosyasıyla çalışır."""
+    home = tmp_path / 'home'
+    home.mkdir()
+    _use_home(monkeypatch, home)
+    return home
@@ -0,0 +1,145 @@
+"""
+Ayar doğrulama, ortam değişkeni, sürüm taşıma ve kaydetme testleri
+"""
+
+import json
+import time
+
+import pytest
+
+from src.utils import config
+from src.utils.config import (
+    CONFIG_VERSION, Config, LoggingSettings, PDFSettings, ScraperSettings, _build_section,
+)
+
+
+def config_path(home):
+    return home / '.webscraper' / 'config.json'
+
+
+def write_config(home, data):
+    path = config_path(home)
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(json.dumps(data), encoding='utf-8')
+
+
+def read_config(home):
+    return json.loads(config_path(home).read_text(encoding='utf-8'))
+
+
+def test_build_section_coerces_types():
+    errors = []
+    section = _build_section(ScraperSettings, {'timeout': '10', 'max_retries': '2', 'unknown': 1}, errors)
+    assert (section.timeout, section.max_retries) == (10.0, 2)
+    assert errors == []
+
+
+@pytest.mark.parametrize('section_cls, values, field_name', [
+    (ScraperSettings, {'timeout': 'abc'}, 'timeout'),
+    (ScraperSettings, {'timeout': 0}, 'timeout'),
+    (ScraperSettings, {'max_retries': 99}, 'max_retries'),
+    (ScraperSettings, {'render_mode': 'bazen'}, 'render_mode'),
+    (PDFSettings, {'highlight_color': 'rd'}, 'highlight_color'),
+])
+def test_build_section_falls_back_to_default(section_cls, values, field_name):
+    errors = []
+    section = _build_section(section_cls, values, errors)
+    assert getattr(section, field_name) == getattr(section_cls(), field_name)
+    assert len(errors) == 1 and field_name in errors[0]
+
+
+def test_build_section_accepts_valid_rules():
+    errors = []
+    logging_settings = _build_section(LoggingSettings, {'level': 'debug'}, errors)
+    pdf = _build_section(PDFSettings, {'highlight_color': 'blue', 'font_size': 24}, errors)
+    assert logging_settings.level == 'DEBUG'
+    assert (pdf.highlight_color, pdf.font_size) == ('blue', 24)
+    assert errors == []
+
+
+def test_new_config_file_is_written_with_defaults(isolated_home):
+    Config()
+    saved = read_config(isolated_home)
+    assert saved['config_version'] == CONFIG_VERSION
+    assert saved['pdf']['margin_bottom'] == PDFSettings().margin_bottom
+
+
+def test_environment_overrides_file(isolated_home, monkeypatch):
+    write_config(isolated_home, {'config_version': CONFIG_VERSION, 'scraper': {'timeout': 20}})
+    monkeypatch.setenv('WEBSCRAPER_SCRAPER__TIMEOUT', '10')
+    monkeypatch.setenv('WEBSCRAPER_LOGGING__FORMAT', 'JSON')
+    monkeypatch.setenv('WEBSCRAPER_PDF__FONT_SIZE', '100')
+
+    cfg = Config()
+
+    assert cfg.settings.scraper.timeout == 10.0
+    assert cfg.settings.logging.format == 'json'
+    assert cfg.settings.pdf.font_size == PDFSettings().font_size
+    assert any('font_size' in error for error in cfg.validation_errors)
+    # Ortam değişkenleri dosyaya yazılmaz
+    assert read_config(isolated_home)['scraper']['timeout'] == 20
+
+
+def test_migration_drops_only_untouched_v1_defaults(isolated_home):
+    write_config(isolated_home, {
+        'pdf': {'margin_top': 50, 'margin_bottom': 18, 'highlight_color': 'red', 'font_size': 12},
+    })
+
+    cfg = Config()
+
+    pdf = cfg.settings.pdf
+    assert (pdf.margin_bottom, pdf.highlight_color) == (PDFSettings().margin_bottom, PDFSettings().highlight_color)
+    assert (pdf.margin_top, pdf.font_size) == (50, 12)
+    saved = read_config(isolated_home)
+    assert saved['config_version'] == CONFIG_VERSION
+    assert saved['pdf']['margin_top'] == 50
+
+
+def test_migration_keeps_user_values(isolated_home):
+    write_config(isolated_home, {'pdf': {'margin_bottom': 30, 'highlight_color': 'blue'}})
+    pdf = Config().settings.pdf
+    assert (pdf.margin_bottom, pdf.highlight_color) == (30, 'blue')
+
+
+def test_current_version_is_not_migrated(isolated_home):
+    write_config(isolated_home, {'config_version': CONFIG_VERSION, 'pdf': {'margin_bottom': 18}})
+    assert Config().settings.pdf.margin_bottom == 18
+
+
+def test_set_is_debounced_until_flush(isolated_home, monkeypatch):
+    monkeypatch.setattr(config, 'SAVE_DELAY', 60)
+    cfg = Config()
+    cfg.set('scraper.timeout', 5)
+    cfg.set('scraper.max_retries', 1)
+
+    # Ayarlar hemen güncellenir, dosya ise henüz yazılmamıştır
+    assert (cfg.settings.scraper.timeout, cfg.get('scraper.max_retries')) == (5.0, 1)
+    assert read_config(isolated_home)['scraper']['timeout'] == ScraperSettings().timeout
+
+    cfg.flush()
+    saved = read_config(isolated_home)
+    assert (saved['scraper']['timeout'], saved['scraper']['max_retries']) == (5, 1)
+
+
+def test_set_saves_after_delay(isolated_home, monkeypatch):
+    monkeypatch.setattr(config, 'SAVE_DELAY', 0.01)
+    cfg = Config()
+    cfg.set('ui.theme', 'koyu')
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline and read_config(isolated_home)['ui']['theme'] != 'koyu':
+        time.sleep(0.01)
+    assert read_config(isolated_home)['ui']['theme'] == 'koyu'
+
+
+def test_failed_save_keeps_previous_file(isolated_home, monkeypatch):
+    cfg = Config()
+    before = config_path(isolated_home).read_text(encoding='utf-8')
+
+    def broken_dump(*args, **kwargs):
+        raise OSError('disk dolu')
+
+    monkeypatch.setattr(config.json, 'dump', broken_dump)
+    cfg._save_config({'scraper': {'timeout': 1}})
+
+    assert config_path(isolated_home).read_text(encoding='utf-8') == before
+    assert list(config_path(isolated_home).parent.glob('*.tmp')) == []
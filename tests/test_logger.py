@@ -0,0 +1,26 @@
+"""
+Toplu yazan log handler'ının boşta kalınca diske yazma testi
+"""
+
+import logging
+import queue
+import time
+
+from src.utils.logger import BatchingFileHandler, BatchingQueueListener
+
+
+def test_idle_listener_flushes_pending_records(tmp_path):
+    log_file = tmp_path / 'test.log'
+    handler = BatchingFileHandler(str(log_file), batch_size=1000, flush_interval=0.1)
+    log_queue = queue.SimpleQueue()
+    listener = BatchingQueueListener(log_queue, handler, flush_interval=handler.flush_interval)
+    listener.start()
+    try:
+        log_queue.put(logging.makeLogRecord({'msg': 'bekleyen kayıt', 'levelno': logging.INFO}))
+        deadline = time.monotonic() + 2
+        while time.monotonic() < deadline and not (log_file.exists() and log_file.stat().st_size):
+            time.sleep(0.05)
+        assert 'bekleyen kayıt' in log_file.read_text(encoding='utf-8')
+    finally:
+        listener.stop()
+        handler.close()
@@ -0,0 +1,37 @@
+"""
+Eşleşme deposu bağlam penceresi testleri
+"""
+
+from src.core.match_store import MatchStore
+
+
+def make_store(text, keyword, radius=10):
+    store = MatchStore(text, context_radius=radius)
+    start = text.find(keyword)
+    while start != -1:
+        store.add(keyword, start, start + len(keyword))
+        start = text.find(keyword, start + 1)
+    return store
+
+
+def test_overlapping_windows_are_merged():
+    store = make_store('veri ve veri ' + 'x' * 50 + ' veri', 'veri')
+    windows = list(store.windows('veri'))
+    assert [len(spans) for _, _, spans in windows] == [2, 1]
+
+
+def test_dense_windows_are_capped():
+    text = 'veri ' * (MatchStore.MAX_WINDOW_SPANS * 3 + 1)
+    store = make_store(text, 'veri')
+    windows = list(store.windows('veri'))
+
+    assert [len(spans) for _, _, spans in windows] == [MatchStore.MAX_WINDOW_SPANS] * 3 + [1]
+    # Bölünen pencereler uç uca gelir: metin tekrarlanmaz, her eşleşme bir kez yer alır
+    for (_, previous_end, _), (next_start, _, spans) in zip(windows, windows[1:]):
+        assert previous_end == next_start == spans[0][0]
+    assert sum(len(spans) for _, _, spans in windows) == store.count('veri')
+
+
+def test_unmerged_windows():
+    store = make_store('veri veri', 'veri')
+    assert len(list(store.windows('veri', merge=False))) == 2
@@ -0,0 +1,38 @@
+"""
+Sayfa istatistikleri testleri
+"""
+
+from src.core.page_stats import PageStats, StatsIndex
+from src.core.scraper import WebScraper
+
+NAV_TEXT = "Ana Sayfa | Haberler » Ekonomi | © 2026 & İletişim | veri merkezi ve veri güvenliği"
+
+
+def test_word_count_ignores_separators():
+    matches = WebScraper._find_matches_in_text(NAV_TEXT, 'veri', False, False)
+    stats = PageStats.from_matches('https://ornek.com', matches, 'veri')
+    assert stats.word_count == 11
+    assert stats.match_count == 2
+    assert stats.density == 2 / 11
+
+
+def test_fuzzy_word_count_comes_from_text_index():
+    matches = WebScraper._find_matches_in_text(NAV_TEXT, 'veri', False, False, WebScraper.MATCH_FUZZY)
+    assert matches.word_count == 11
+    assert PageStats.from_matches('https://ornek.com', matches, 'veri').word_count == 11
+
+
+def test_empty_text():
+    matches = WebScraper._find_matches_in_text('', 'veri', False, False)
+    stats = PageStats.from_matches('https://ornek.com', matches, 'veri')
+    assert (stats.word_count, stats.density) == (0, 0.0)
+
+
+def test_density_ranking_is_not_skewed_by_separators():
+    index = StatsIndex()
+    # Ayraçlar kelime sayılsaydı menü sayfasının yoğunluğu 1/12 olurdu
+    for url, text in (('https://menu.com', 'veri ' + '| ' * 10 + 'kelime'),
+                      ('https://makale.com', 'veri kelime kelime kelime')):
+        matches = WebScraper._find_matches_in_text(text, 'veri', False, False)
+        index.add(PageStats.from_matches(url, matches, 'veri'))
+    assert [stats.density for stats in index.top_by_density(2)] == [0.5, 0.25]
@@ -0,0 +1,156 @@
+"""
+Host bazlı token-bucket zamanlayıcı testleri (sahte saat ile deterministik)
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import rate_limiter, scraper
+from src.core.rate_limiter import HostScheduler, TokenBucket
+from src.core.scraper import WebScraper
+
+
+class FakeClock:
+    """time.monotonic yerine geçer; Condition.wait süreyi beklemek yerine saati ilerletir."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class FakeCondition:
+    def __init__(self, clock):
+        self.clock = clock
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def wait(self, timeout):
+        self.clock.advance(timeout)
+
+    def notify_all(self):
+        pass
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, 'time', SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+
+def make_scheduler(clock, **kwargs):
+    scheduler = HostScheduler(**kwargs)
+    scheduler._cond = FakeCondition(clock)
+    return scheduler
+
+
+def test_bucket_allows_burst_then_refills_at_rate(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    for _ in range(3):
+        assert bucket.wait_time(clock.now) == 0
+        bucket.consume()
+    assert bucket.wait_time(clock.now) == pytest.approx(0.5)
+
+    clock.advance(0.25)
+    assert bucket.wait_time(clock.now) == pytest.approx(0.25)
+
+    # Uzun bekleme sonrası token sayısı burst'ü aşmaz
+    clock.advance(100)
+    bucket.wait_time(clock.now)
+    assert bucket.tokens == 3
+
+
+def test_acquire_waits_for_next_token(clock):
+    scheduler = make_scheduler(clock, requests_per_second=1, burst=1)
+    scheduler.acquire('https://a.com/1')
+    assert clock.now == 1000.0
+    scheduler.acquire('https://a.com/2')
+    assert clock.now == pytest.approx(1001.0)
+
+
+def test_fair_order_round_robins_hosts(clock):
+    scheduler = make_scheduler(clock, requests_per_second=1, burst=10)
+    urls = ['https://a.com/1', 'https://a.com/2', 'https://a.com/3', 'https://b.com/1', 'https://c.com/1']
+    assert list(scheduler.fair_order(urls)) == [
+        'https://a.com/1', 'https://b.com/1', 'https://c.com/1', 'https://a.com/2', 'https://a.com/3',
+    ]
+
+
+def test_fair_order_skips_throttled_host(clock):
+    scheduler = make_scheduler(clock, requests_per_second=1, burst=1, max_backoff=300)
+    scheduler.feedback('https://a.com/', 429, retry_after=10)
+
+    issued = [(url, clock.now - 1000) for url in
+              scheduler.fair_order(['https://a.com/1', 'https://b.com/1', 'https://b.com/2'])]
+
+    # a.com 10 sn bekletilirken b.com'un URL'leri kendi hızında verilir
+    assert [url for url, _ in issued] == ['https://b.com/1', 'https://b.com/2', 'https://a.com/1']
+    assert [round(at, 6) for _, at in issued] == [0, 1, 10]
+
+
+def test_slow_down_and_recover(clock):
+    scheduler = make_scheduler(clock, requests_per_second=2, backoff_factor=0.5)
+    url = 'https://a.com/'
+    scheduler.feedback(url, 503)
+    bucket = scheduler._buckets['a.com']
+    assert bucket.rate == 1.0
+    assert bucket.blocked_until == pytest.approx(clock.now + 1.0)
+
+    scheduler.feedback(url, 429)
+    assert bucket.rate == 0.5
+
+    # Başarılı yanıtlar hızı temel değerin %10'u kadar adımlarla geri getirir, temeli aşmaz
+    scheduler.feedback(url, 200)
+    assert bucket.rate == pytest.approx(0.7)
+    for _ in range(20):
+        scheduler.feedback(url, 200)
+    assert bucket.rate == 2.0
+
+    # 4xx hataları hızı değiştirmez
+    scheduler.feedback(url, 503)
+    scheduler.feedback(url, 404)
+    assert bucket.rate == 1.0
+
+
+def test_retry_after_is_capped(clock):
+    scheduler = make_scheduler(clock, max_backoff=300)
+    scheduler.feedback('https://a.com/', 429, retry_after=86400)
+    assert scheduler._buckets['a.com'].blocked_until == clock.now + 300
+
+
+def test_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        HostScheduler(requests_per_second=0)
+
+
+class FixedDatetime(datetime):
+    NOW = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.NOW
+
+
+@pytest.mark.parametrize('header, expected', [
+    (None, None),
+    ('120', 120.0),
+    (format_datetime(FixedDatetime.NOW + timedelta(seconds=90), usegmt=True), 90.0),
+    (format_datetime(FixedDatetime.NOW - timedelta(seconds=90), usegmt=True), 0.0),
+    ('yarın', None),
+])
+def test_retry_after_header(monkeypatch, header, expected):
+    monkeypatch.setattr(scraper, 'datetime', FixedDatetime)
+    response = SimpleNamespace(headers={'Retry-After': header} if header is not None else {})
+    assert WebScraper()._retry_after(response) == expected
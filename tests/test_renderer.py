@@ -0,0 +1,54 @@
+"""
+Headless tarayıcı havuzunun başlatma hatası testleri
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import renderer
+
+
+class FakePlaywright:
+    """chromium.launch() başarısız olan Playwright sürücüsü."""
+
+    def __init__(self):
+        self.stopped = 0
+        self.chromium = SimpleNamespace(launch=self._launch)
+
+    async def _launch(self, **kwargs):
+        raise RuntimeError("Executable doesn't exist")
+
+    async def stop(self):
+        self.stopped += 1
+
+
+@pytest.fixture
+def drivers(monkeypatch):
+    started = []
+
+    def fake_async_playwright():
+        async def start():
+            driver = FakePlaywright()
+            started.append(driver)
+            return driver
+        return SimpleNamespace(start=start)
+
+    monkeypatch.setattr(renderer, 'async_playwright', fake_async_playwright)
+    return started
+
+
+def test_failed_launch_stops_driver_and_is_remembered(drivers):
+    pool = renderer.BrowserPool(size=1)
+    try:
+        with pytest.raises(RuntimeError, match="Executable"):
+            pool.render('https://ornek.com')
+        assert [driver.stopped for driver in drivers] == [1]
+        assert pool.start_error is not None
+
+        # Sonraki çağrılar yeni sürücü başlatmadan başarısız olur
+        with pytest.raises(RuntimeError, match="başlatılamadı"):
+            pool.render('https://ornek.com/2')
+        assert len(drivers) == 1
+    finally:
+        pool.close()
@@ -0,0 +1,125 @@
+"""
+Tarayıcıda render etme kararı ve render yapılamadığında statik içeriğe dönüş testleri
+"""
+
+import os
+import threading
+from dataclasses import replace
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from src.core import renderer
+from src.core.scraper import WebScraper
+
+URL = 'https://ornek.com/uygulama'
+
+# Görünür metni olmayan, script ile doldurulan kabuk sayfa
+SHELL_PAGE = (b'<html><head><title>Kabuk</title><script src="app.js"></script></head>'
+              b'<body><div id="root"></div></body></html>')
+RENDERED_PAGE = ('<html><head><title>Kabuk</title></head><body><p>'
+                 + 'veri analizi ' * 30 + '</p></body></html>')
+
+
+def make_scraper(render_mode):
+    scraper = WebScraper()
+    scraper.settings = replace(scraper.settings, render_mode=render_mode)
+    scraper.pdf_generator = mock.Mock()
+    scraper.pdf_generator.create_pdf.return_value = 'rapor.pdf'
+    return scraper
+
+
+@pytest.mark.parametrize('render_mode, text, client_rendered, expected', [
+    (WebScraper.RENDER_OFF, '', True, False),
+    (WebScraper.RENDER_ALWAYS, 'x' * 1000, False, True),
+    (WebScraper.RENDER_AUTO, '', True, True),
+    (WebScraper.RENDER_AUTO, '', False, False),
+    (WebScraper.RENDER_AUTO, 'x' * WebScraper.MIN_STATIC_TEXT_LENGTH, True, False),
+])
+def test_should_render(render_mode, text, client_rendered, expected):
+    scraper = make_scraper(render_mode)
+    assert scraper._should_render(text, client_rendered) is expected
+
+
+def test_render_page_returns_none_without_playwright(monkeypatch):
+    monkeypatch.setattr(renderer, 'is_available', lambda: False)
+    pool_factory = mock.Mock()
+    monkeypatch.setattr(renderer, 'get_browser_pool', pool_factory)
+
+    assert make_scraper(WebScraper.RENDER_AUTO)._render_page(URL) is None
+    pool_factory.assert_not_called()
+
+
+def test_render_page_returns_none_on_render_error(monkeypatch):
+    pool = mock.Mock(start_error=None)
+    pool.render.side_effect = TimeoutError('zaman aşımı')
+    monkeypatch.setattr(renderer, 'is_available', lambda: True)
+    monkeypatch.setattr(renderer, 'get_browser_pool', lambda *args, **kwargs: pool)
+
+    assert make_scraper(WebScraper.RENDER_AUTO)._render_page(URL) is None
+    pool.render.assert_called_once_with(URL)
+
+
+def test_render_page_skips_pool_that_failed_to_start(monkeypatch):
+    pool = mock.Mock(start_error=RuntimeError('chromium yok'))
+    monkeypatch.setattr(renderer, 'is_available', lambda: True)
+    monkeypatch.setattr(renderer, 'get_browser_pool', lambda *args, **kwargs: pool)
+
+    assert make_scraper(WebScraper.RENDER_AUTO)._render_page(URL) is None
+    pool.render.assert_not_called()
+
+
+def test_scrape_and_save_keeps_static_content_when_renderer_unavailable(monkeypatch, tmp_path):
+    monkeypatch.setattr(renderer, 'is_available', lambda: False)
+    scraper = make_scraper(WebScraper.RENDER_AUTO)
+    scraper._fetch_page = mock.Mock(return_value=SimpleNamespace(content=SHELL_PAGE))
+
+    assert scraper.scrape_and_save(URL, 'veri', str(tmp_path)) == ('rapor.pdf', 0)
+    page_info = scraper.pdf_generator.create_pdf.call_args[0][2]
+    assert page_info['title'] == 'Kabuk'
+
+
+def test_scrape_many_keeps_static_content_when_renderer_unavailable(monkeypatch, tmp_path):
+    monkeypatch.setattr(renderer, 'is_available', lambda: False)
+    scraper = make_scraper(WebScraper.RENDER_AUTO)
+    scraper.fetch_many = lambda urls: iter([(URL, SimpleNamespace(content=SHELL_PAGE), None)])
+
+    results = scraper.scrape_many([URL], 'veri', str(tmp_path), processes=1)
+
+    pdf_path, match_count = results[URL]
+    assert match_count == 0 and os.path.exists(pdf_path)
+    assert scraper.stats_index.get(URL) is not None
+
+
+def test_scrape_many_renders_off_the_main_thread(tmp_path):
+    scraper = make_scraper(WebScraper.RENDER_AUTO)
+    scraper.fetch_many = lambda urls: iter([(URL, SimpleNamespace(content=SHELL_PAGE), None)])
+    render_threads = []
+
+    def render(url):
+        render_threads.append(threading.current_thread())
+        return RENDERED_PAGE
+
+    scraper._render_page = render
+    results = scraper.scrape_many([URL], 'veri', str(tmp_path), processes=1)
+
+    pdf_path, match_count = results[URL]
+    assert match_count == 30 and os.path.exists(pdf_path)
+    assert scraper.stats_index.get(URL).match_count == 30
+    assert render_threads and render_threads[0] is not threading.main_thread()
+
+
+def test_scrape_many_writes_one_report_per_url(monkeypatch, tmp_path):
+    monkeypatch.setattr(renderer, 'is_available', lambda: False)
+    scraper = WebScraper()
+    urls = [f'https://site{i % 2}.com/sayfa/{i}' for i in range(4)]
+    page = ('<html><head><title>Sayfa</title></head><body><p>'
+            + 'veri analizi ' * 30 + '</p></body></html>').encode('utf-8')
+    scraper.fetch_many = lambda urls: iter([(url, SimpleNamespace(content=page), None) for url in urls])
+
+    results = scraper.scrape_many(urls, 'veri', str(tmp_path), processes=2)
+
+    paths = {pdf_path for pdf_path, _ in results.values()}
+    assert len(paths) == len(urls)
+    assert sorted(p.name for p in tmp_path.glob('*.pdf')) == sorted(os.path.basename(p) for p in paths)
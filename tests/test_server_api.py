@@ -0,0 +1,110 @@
+"""
+HTTP sunucu isteği doğrulama testleri
+"""
+
+import http.client
+import json
+import threading
+from http.server import ThreadingHTTPServer
+from unittest import mock
+
+import pytest
+
+from src.server.api import ScanRequestHandler
+
+
+@pytest.fixture
+def server():
+    manager = mock.Mock()
+    manager.stats.return_value = {'queued': 0}
+    manager.submit.return_value.id = 'a' * 32
+    manager.submit.return_value.to_dict.return_value = {'id': 'a' * 32}
+    handler = type('Handler', (ScanRequestHandler,), {'manager': manager})
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield httpd, manager
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def request(httpd, method, path, body=None, headers=None):
+    connection = http.client.HTTPConnection(*httpd.server_address, timeout=5)
+    try:
+        connection.request(method, path, body=body, headers=headers or {})
+        response = connection.getresponse()
+        return response.status, json.loads(response.read() or b'null')
+    finally:
+        connection.close()
+
+
+def post_scan(httpd, payload):
+    return request(httpd, 'POST', '/scans', json.dumps(payload).encode('utf-8'),
+                   {'Content-Type': 'application/json'})
+
+
+def test_valid_scan_is_accepted(server):
+    httpd, manager = server
+    status, _ = post_scan(httpd, {'url': 'https://ornek.com', 'keyword': 'veri', 'case_sensitive': True})
+    assert status == 202
+    assert manager.submit.call_args[0][3:] == (True, False, 'exact')
+
+
+@pytest.mark.parametrize('field', ['case_sensitive', 'whole_word'])
+@pytest.mark.parametrize('value', ['false', 0, 1, None])
+def test_non_boolean_flags_are_rejected(server, field, value):
+    httpd, manager = server
+    status, body = post_scan(httpd, {'url': 'https://ornek.com', 'keyword': 'veri', field: value})
+    assert status == 400
+    assert field in body['error']
+    manager.submit.assert_not_called()
+
+
+@pytest.mark.parametrize('payload', [[1, 2], 'veri', 42])
+def test_non_object_body_is_rejected(server, payload):
+    httpd, manager = server
+    assert post_scan(httpd, payload)[0] == 400
+    manager.submit.assert_not_called()
+
+
+def test_negative_content_length_is_rejected(server):
+    httpd, manager = server
+    status, _ = request(httpd, 'POST', '/scans', headers={'Content-Length': '-1'})
+    assert status == 400
+    manager.submit.assert_not_called()
+
+
+@pytest.mark.parametrize('path', ['/health', '/health?x=1', '/health#bolum'])
+def test_query_string_does_not_affect_routing(server, path):
+    httpd, _ = server
+    assert request(httpd, 'GET', path) == (200, {'queued': 0})
+
+
+def test_job_path_with_query_string(server):
+    httpd, manager = server
+    manager.get.return_value.to_dict.return_value = {'id': 'b' * 32}
+    assert request(httpd, 'GET', f"/scans/{'b' * 32}?ts=1") == (200, {'id': 'b' * 32})
+    manager.get.assert_called_once_with('b' * 32)
+
+
+def test_prune_drops_stats_of_expired_jobs(tmp_path):
+    from src.core.page_stats import StatsIndex
+    from src.server.api import JobManager, ScanJob
+
+    manager = object.__new__(JobManager)
+    manager.settings = mock.Mock(job_ttl=60, report_dir=str(tmp_path))
+    manager.scraper = mock.Mock(stats_index=StatsIndex())
+    manager.jobs = {}
+    for url, finished in (('https://a.com', 0), ('https://b.com', 0), ('https://b.com', None)):
+        job = ScanJob('127.0.0.1', url, 'veri', False, False, 'exact')
+        if finished is not None:
+            job.set_status(ScanJob.DONE)
+            job.finished = finished
+        manager.jobs[job.id] = job
+        manager.scraper.stats_index.add(mock.Mock(url=url))
+
+    manager._prune()
+
+    assert [job.url for job in manager.jobs.values()] == ['https://b.com']
+    assert manager.scraper.stats_index.get('https://a.com') is None
+    assert manager.scraper.stats_index.get('https://b.com') is not None
@@ -0,0 +1,69 @@
+"""
+Türkçe kelime indeksi benzerlik araması testleri
+"""
+
+import pytest
+
+from src.core.text_index import TextIndex, _within_one_edit
+
+
+@pytest.mark.parametrize('a, b, expected', [
+    ('kadar', 'kadar', True),
+    ('kadar', 'kadir', True),    # değiştirme
+    ('kadar', 'kadarr', True),   # ekleme
+    ('kadar', 'kada', True),     # silme
+    ('kadar', 'kadro', False),   # iki işlem
+    ('kadar', 'akdar', False),   # yer değiştirme iki işlemdir
+    ('kadar', 'kad', False),
+])
+def test_within_one_edit(a, b, expected):
+    assert _within_one_edit(a, b) is expected
+    assert _within_one_edit(b, a) is expected
+
+
+def test_similar_terms_excludes_distance_two():
+    index = TextIndex("Bu kadar kadro ve kadir yeter")
+    assert index._similar_terms('kadar') == {'kadar', 'kadir'}
+
+
+def found_words(text, keyword):
+    return [text[start:end] for start, end in TextIndex(text).find(keyword)]
+
+
+def test_find_inflected_forms():
+    text = "Sürdürülebilirliğin önemi: sürdürülebilirlik ve SÜRDÜRÜLEBİLİRLİK raporu."
+    assert found_words(text, 'sürdürülebilirlik') == [
+        'Sürdürülebilirliğin', 'sürdürülebilirlik', 'SÜRDÜRÜLEBİLİRLİK',
+    ]
+
+
+def test_find_consonant_softening():
+    text = "Kitabı aldım, kitapları taşıdım, kitap okudum."
+    assert found_words(text, 'kitap') == ['Kitabı', 'kitapları', 'kitap']
+
+
+@pytest.mark.parametrize('keyword', ['ılık', 'ILIK', 'Ilık', 'ilik', 'İLİK'])
+def test_find_folds_dotted_and_dotless_i(keyword):
+    text = "Ilık bir gün, ILIK rüzgâr ve ılık deniz."
+    assert found_words(text, keyword) == ['Ilık', 'ILIK', 'ılık']
+
+
+def test_find_multi_word_keyword():
+    text = "Yenilenebilir enerjinin payı arttı. Enerji yenilenebilir değil. Yenilenebilir enerji kaynakları."
+    assert found_words(text, 'yenilenebilir enerji') == ['Yenilenebilir enerjinin', 'Yenilenebilir enerji']
+
+
+def test_find_spans_map_to_original_offsets():
+    text = "  Önce\tİstanbul'da,\n\nsonra  İSTANBUL'un dışında."
+    spans = TextIndex(text).find('istanbul')
+    assert spans == [(text.index('İstanbul'), text.index('İstanbul') + len('İstanbul')),
+                     (text.index('İSTANBUL'), text.index('İSTANBUL') + len('İSTANBUL'))]
+
+
+def test_find_tolerates_one_typo_only():
+    text = "Ekonomi büyüdü. Ekonmi haberleri. Ekenmi değil."
+    assert found_words(text, 'ekonomi') == ['Ekonomi', 'Ekonmi']
+
+
+def test_find_empty_keyword():
+    assert TextIndex("metin").find('  ') == []